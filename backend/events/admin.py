@@ -9,8 +9,9 @@ class TeamAdmin(admin.ModelAdmin):
     list_per_page = 50
 
     def member_count(self, obj):
-        return obj.members.count()
+        return obj.member_count
     member_count.short_description = 'Members'
+    member_count.admin_order_field = 'member_count'
 
 
 @admin.register(Participant)
@@ -5,3 +5,11 @@ class EventsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'events'
     verbose_name = 'NFC Event Management'
+
+    def ready(self):
+        from . import db, signals  # noqa: F401
+        from .schedule import get_schedule
+
+        # Compile the distribution schedule up front so bad settings fail at startup.
+        get_schedule()
+        db.check_replica_cache()
@@ -0,0 +1,26 @@
+"""
+Token authentication with an in-process cache in front of the Token/User lookup.
+"""
+
+from rest_framework.authentication import TokenAuthentication
+
+from .cache import token_cache
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    DRF TokenAuthentication that remembers valid tokens, so authenticated
+    requests on a warm worker run no authentication query.
+
+    Only successful lookups are cached. Deleting a token or saving its user
+    (e.g. deactivating them) invalidates the entry through signals; the
+    TOKEN_CACHE_TTL bounds staleness for changes made by other processes.
+    """
+
+    def authenticate_credentials(self, key):
+        cached = token_cache.get(key)
+        if cached is not None:
+            return cached
+        user, token = super().authenticate_credentials(key)
+        token_cache.set(key, (user, token))
+        return user, token
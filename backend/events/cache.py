@@ -0,0 +1,204 @@
+"""
+In-process caches for the hot request paths.
+
+Each worker process keeps its own copy, so entries are bounded both in size
+(LRU eviction) and in age (TTL). Writes made through the API invalidate the
+affected entries explicitly; the TTL only bounds staleness for writes made
+by another worker process.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class LRUTTLCache:
+    """
+    A thread-safe, bounded LRU cache whose entries expire after `ttl` seconds.
+    Keeps hit/miss/eviction counters for monitoring.
+    """
+
+    def __init__(self, max_entries=1024, ttl=30.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """Returns the cached value for `key`, or None on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, value):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._added(key, value)
+            while len(self._data) > self.max_entries:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._cleared()
+
+    def stats(self):
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    # Hooks for subclasses that maintain secondary indexes (called with the lock held).
+
+    def _remove(self, key):
+        del self._data[key]
+
+    def _added(self, key, value):
+        pass
+
+    def _cleared(self):
+        pass
+
+
+class ScanPayloadCache(LRUTTLCache):
+    """
+    Caches fully built /api/scan/ payloads keyed by normalized UID.
+
+    Also indexes cached UIDs by team primary key, since a team's membership
+    change alters `team_size` in every member's payload.
+
+    A scan can read a row, lose the CPU to a write that commits and
+    invalidates, and then put() the payload it built from the old row. To
+    stop that, readers take generation() before the database lookup and pass
+    it to put(), which drops the payload if its UID or team was invalidated
+    since. Invalidation stamps are kept for the most recent `max_entries`
+    UIDs/teams; older ones fold into a floor that rejects any put() from
+    before it, so the bookkeeping stays bounded and errs on not caching.
+    """
+
+    def __init__(self, max_entries=4096, ttl=30.0):
+        super().__init__(max_entries=max_entries, ttl=ttl)
+        self._uid_team = {}
+        self._team_uids = {}
+        self._clock = 0
+        self._floor = 0
+        self._stamps = OrderedDict()  # ('uid', uid) / ('team', pk) -> clock at invalidation
+
+    def generation(self):
+        """Returns the token to pass to put() for a payload read from now on."""
+        with self._lock:
+            return self._clock
+
+    def put(self, uid, payload, team_pk=None, generation=None):
+        """
+        Caches `payload` unless `uid` or `team_pk` was invalidated after
+        `generation` was taken. Returns True if the payload was stored.
+        """
+        with self._lock:
+            if generation is not None and (
+                self._stamps.get(('uid', uid), self._floor) > generation
+                or (team_pk is not None and self._stamps.get(('team', team_pk), self._floor) > generation)
+            ):
+                return False
+        self.set(uid, (team_pk, payload))
+        return True
+
+    def lookup(self, uid):
+        entry = self.get(uid)
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, *keys):
+        with self._lock:
+            for key in keys:
+                if key in self._data:
+                    self._remove(key)
+                self._stamp(('uid', key))
+
+    def invalidate_team(self, team_pk):
+        """Drops the cached payload of every member of the given team."""
+        if team_pk is None:
+            return
+        with self._lock:
+            for uid in list(self._team_uids.get(team_pk, ())):
+                self._remove(uid)
+            self._stamp(('team', team_pk))
+
+    def _stamp(self, key):
+        self._clock += 1
+        self._stamps[key] = self._clock
+        self._stamps.move_to_end(key)
+        while len(self._stamps) > self.max_entries:
+            _, stamp = self._stamps.popitem(last=False)
+            self._floor = max(self._floor, stamp)
+
+    def _remove(self, key):
+        super()._remove(key)
+        team_pk = self._uid_team.pop(key, None)
+        if team_pk is not None:
+            uids = self._team_uids.get(team_pk)
+            if uids is not None:
+                uids.discard(key)
+                if not uids:
+                    del self._team_uids[team_pk]
+
+    def _added(self, key, value):
+        team_pk = value[0]
+        if team_pk is not None:
+            self._uid_team[key] = team_pk
+            self._team_uids.setdefault(team_pk, set()).add(key)
+
+    def _cleared(self):
+        self._uid_team.clear()
+        self._team_uids.clear()
+        self._clock += 1
+        self._floor = self._clock
+        self._stamps.clear()
+
+
+scan_cache = ScanPayloadCache(
+    max_entries=getattr(settings, 'SCAN_CACHE_MAX_ENTRIES', 4096),
+    ttl=getattr(settings, 'SCAN_CACHE_TTL', 30.0),
+)
+
+# Authenticated (user, token) pairs keyed by token key; see authentication.py.
+token_cache = LRUTTLCache(
+    max_entries=getattr(settings, 'TOKEN_CACHE_MAX_ENTRIES', 1024),
+    ttl=getattr(settings, 'TOKEN_CACHE_TTL', 60.0),
+)
@@ -0,0 +1,78 @@
+"""
+Data version and conditional GET support for the read endpoints.
+
+The version is read, never written, by the distribution paths. Inserts and
+updates stamp the indexed updated_at of Participant, Team and
+PreRegisteredMember (queryset.update() and bulk_create() paths included),
+so the newest stamp moves with them. Deletes leave no stamp behind and bump
+the DataVersion counter from a post_delete receiver, inside the deleting
+transaction (see signals.py). Read endpoints decorated with
+@etag_on_data_version answer If-None-Match with 304 Not Modified after that
+single query, before running their own queries.
+
+updated_at is stamped before the write commits, up to
+settings.WRITE_SETTLE_SECONDS before. A write stamped earlier than the
+newest stamp can still commit after it without moving the version, so the
+version only counts as settled once the newest stamp is that old.
+
+ETags use the shorter settings.ETAG_SETTLE_SECONDS instead, so that a desk
+scanning every few seconds still gets 304s. The trade-off: a write that
+took longer than that from stamp to commit (one that waited on a lock) and
+committed behind a newer stamp is not reflected in the ETag until the next
+write moves the version. Clients that cannot tolerate that use the
+/api/changes/ feed, which re-reads the full WRITE_SETTLE_SECONDS.
+"""
+
+import hashlib
+from datetime import timedelta
+from functools import wraps
+
+from django.conf import settings
+from django.utils import timezone
+from django.views.decorators.http import condition
+
+from .models import DataVersion
+
+
+def current_data_version(using=None, settle_seconds=None):
+    """
+    Returns (version, settled). Once settled, the version changes with every
+    later committed write; until then a write already stamped may commit
+    without changing it. settle_seconds defaults to WRITE_SETTLE_SECONDS.
+    """
+    if settle_seconds is None:
+        settle_seconds = settings.WRITE_SETTLE_SECONDS
+    deletes, newest = DataVersion.latest(using)
+    if newest is None:
+        return str(deletes), True
+    settled = timezone.now() - newest >= timedelta(seconds=settle_seconds)
+    return f'{deletes}-{newest.timestamp():.6f}', settled
+
+
+def data_version_etag(request, *args, **kwargs):
+    """
+    ETag for a read endpoint: the data version plus a digest of the full
+    path. None (no ETag, so no 304) while the version is not settled by
+    ETAG_SETTLE_SECONDS.
+    """
+    version, settled = current_data_version(settle_seconds=settings.ETAG_SETTLE_SECONDS)
+    if not settled:
+        return None
+    path = hashlib.blake2s(request.get_full_path().encode(), digest_size=6).hexdigest()
+    return f'{version}-{path}'
+
+
+def etag_on_data_version(view):
+    """
+    condition() with data_version_etag. Error responses (e.g. an unknown
+    team's 404) are sent without the ETag.
+    """
+    conditional = condition(etag_func=data_version_etag)(view)
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        response = conditional(request, *args, **kwargs)
+        if response.status_code >= 400:
+            del response['ETag']
+        return response
+    return wrapper
@@ -0,0 +1,115 @@
+"""
+Database connection setup and primary/replica routing.
+
+- SQLite connections get settings.SQLITE_PRAGMAS applied when they are
+  opened (WAL, synchronous=NORMAL, busy timeout, cache and mmap sizes).
+- PrimaryReplicaRouter sends reads made inside views decorated with
+  @read_from_replica to the "replica" alias, when one is configured. All
+  writes, and reads everywhere else, go to the primary ("default").
+- ReadAfterWriteMiddleware pins a client to the primary for
+  REPLICA_PIN_SECONDS after each successful write. Its next reads then see
+  its own writes even while the replica lags. Pins live in the default
+  Django cache, which every worker process must share (REDIS_URL or
+  CACHE_DIR): with a per-process cache, check_replica_cache() refuses to
+  start.
+"""
+
+import hashlib
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import DEFAULT_DB_ALIAS
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+
+REPLICA_ALIAS = 'replica'
+
+_use_replica = ContextVar('use_replica', default=False)
+
+_SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+
+@receiver(connection_created)
+def apply_sqlite_pragmas(sender, connection, **kwargs):
+    if connection.vendor != 'sqlite' or not settings.SQLITE_PRAGMAS:
+        return
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {name} = {value}')
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def check_replica_cache():
+    """
+    Raises ImproperlyConfigured when a replica is configured but the default
+    cache is per process: a pin set by one worker would be missed by the
+    others, which would serve the client stale reads from the replica.
+    """
+    if replica_configured() and isinstance(caches['default'], (LocMemCache, DummyCache)):
+        raise ImproperlyConfigured(
+            'DATABASE_REPLICA_URL needs a cache shared by the worker processes; '
+            'set REDIS_URL or CACHE_DIR.'
+        )
+
+
+class PrimaryReplicaRouter:
+    def db_for_read(self, model, **hints):
+        if _use_replica.get() and replica_configured():
+            return REPLICA_ALIAS
+        return None
+
+    def db_for_write(self, model, **hints):
+        # Explicit, so objects read from the replica are still saved to the primary.
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data.
+        return True
+
+
+def _pin_key(request):
+    credential = (
+        request.META.get('HTTP_AUTHORIZATION')
+        or request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+        or request.META.get('REMOTE_ADDR', '')
+    )
+    return 'replica-pin:' + hashlib.sha256(credential.encode()).hexdigest()
+
+
+def is_pinned_to_primary(request):
+    return cache.get(_pin_key(request)) is not None
+
+
+def read_from_replica(view):
+    """Routes the view's reads to the replica unless the client wrote recently."""
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        token = _use_replica.set(replica_configured() and not is_pinned_to_primary(request))
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _use_replica.reset(token)
+    return wrapper
+
+
+class ReadAfterWriteMiddleware:
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            request.method not in _SAFE_METHODS
+            and response.status_code < 400
+            and replica_configured()
+        ):
+            cache.set(_pin_key(request), True, settings.REPLICA_PIN_SECONDS)
+        return response
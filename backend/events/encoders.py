@@ -0,0 +1,126 @@
+"""
+Hand-written row encoders for the participant list endpoints.
+
+They return exactly what ParticipantSerializer and TeamMemberSerializer
+return, without DRF's per-row field introspection, which dominates the cost
+of large attendee lists. Keep them in sync with the serializers;
+EncoderParityTest compares the two.
+
+The *_columns encoders build the ?format=columnar shape instead: one array
+per field, the item flags as the stored Participant.items_mask and
+timestamps as integer epoch seconds.
+"""
+
+from django.conf import settings
+from django.utils import timezone
+
+from .items import ITEM_FIELDS
+
+# (flag field, timestamp field) of each item, in ITEM_FIELDS (bit) order.
+_ITEMS = tuple((flag, time_field) for flag, time_field, _ in ITEM_FIELDS.values())
+
+_FLAGS = tuple(flag for flag, _ in _ITEMS)
+_TIMES = tuple(time_field for _, time_field in _ITEMS)
+
+
+def _current_timezone():
+    return timezone.get_current_timezone() if settings.USE_TZ else None
+
+
+def _datetime(value, tz):
+    """DRF DateTimeField output: ISO 8601 in the current timezone, 'Z' for UTC."""
+    if value is None:
+        return None
+    if tz is not None and timezone.is_aware(value):
+        value = value.astimezone(tz)
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def _participant(row, tz):
+    team = row.team
+    data = {
+        'uid': row.uid,
+        'name': row.name,
+        'college': row.college,
+        'team_id': team.team_id if team else '',
+        'team_name': team.team_name if team else 'Individual',
+        'team_color': team.team_color if team else '#00E676',
+        'team_size': team.member_count if team else 1,
+    }
+    for flag, time_field in _ITEMS:
+        data[flag] = getattr(row, flag)
+        data[time_field] = _datetime(getattr(row, time_field), tz)
+    return data
+
+
+def _team_member(row):
+    data = {'uid': row.uid, 'name': row.name, 'college': row.college}
+    for flag in _FLAGS:
+        data[flag] = getattr(row, flag)
+    data['items_collected'] = bin(row.items_mask).count('1')
+    times = [t for t in map(row.__getattribute__, _TIMES) if t is not None]
+    # TeamMemberSerializer.get_last_scan uses the raw isoformat().
+    data['last_scan'] = max(times).isoformat() if times else None
+    return data
+
+
+def encode_participant(row):
+    """ParticipantSerializer(row).data for a participant with its team preloaded."""
+    return _participant(row, _current_timezone())
+
+
+def encode_participants(rows):
+    """ParticipantSerializer(rows, many=True).data."""
+    tz = _current_timezone()
+    return [_participant(row, tz) for row in rows]
+
+
+def encode_team_members(rows):
+    """TeamMemberSerializer(rows, many=True).data."""
+    return [_team_member(row) for row in rows]
+
+
+def _epoch(value):
+    return int(value.timestamp()) if value is not None else None
+
+
+def encode_participant_columns(rows):
+    """Participant rows as column arrays (?format=columnar)."""
+    columns = {
+        key: [] for key in (
+            'uid', 'name', 'college', 'team_id', 'team_name', 'team_color', 'team_size',
+            'items_mask', *_TIMES,
+        )
+    }
+    for row in rows:
+        team = row.team
+        columns['uid'].append(row.uid)
+        columns['name'].append(row.name)
+        columns['college'].append(row.college)
+        columns['team_id'].append(team.team_id if team else '')
+        columns['team_name'].append(team.team_name if team else 'Individual')
+        columns['team_color'].append(team.team_color if team else '#00E676')
+        columns['team_size'].append(team.member_count if team else 1)
+        columns['items_mask'].append(row.items_mask)
+        for time_field in _TIMES:
+            columns[time_field].append(_epoch(getattr(row, time_field)))
+    return columns
+
+
+def encode_team_member_columns(rows):
+    """
+    Team member rows as column arrays (?format=columnar). items_collected is
+    left out: it is the number of bits set in items_mask.
+    """
+    columns = {key: [] for key in ('uid', 'name', 'college', 'items_mask', 'last_scan')}
+    for row in rows:
+        columns['uid'].append(row.uid)
+        columns['name'].append(row.name)
+        columns['college'].append(row.college)
+        columns['items_mask'].append(row.items_mask)
+        times = [t for t in map(row.__getattribute__, _TIMES) if t is not None]
+        columns['last_scan'].append(_epoch(max(times)) if times else None)
+    return columns
@@ -0,0 +1,145 @@
+"""
+Constant-memory CSV/XLSX writers for the attendee export endpoints.
+
+Rows are pulled from a server-side queryset iterator and encoded as they are
+produced, so an export holds at most one batch of rows in memory. The XLSX
+writer emits a minimal SpreadsheetML package (inline strings, no shared
+string table) through zipfile's streaming mode, so no temporary file or
+third-party dependency is needed.
+"""
+
+import csv
+import zipfile
+from xml.sax.saxutils import escape
+
+from django.utils import timezone
+
+from .items import ITEM_FIELDS
+
+EXPORT_HEADER = ['UID', 'Name', 'College', 'Team'] + [
+    column
+    for _, _, label in ITEM_FIELDS.values()
+    for column in (label, f'{label} Time')
+]
+
+
+def export_rows(participants):
+    """Yields the header, then one list of cell strings per participant."""
+    yield EXPORT_HEADER
+    for p in participants:
+        row = [p.uid, p.name, p.college, p.team.team_name if p.team else 'Solo']
+        for field, time_field, _ in ITEM_FIELDS.values():
+            collected_at = getattr(p, time_field)
+            row.append('YES' if getattr(p, field) else 'NO')
+            row.append(timezone.localtime(collected_at).strftime('%Y-%m-%d %H:%M:%S') if collected_at else '')
+        yield row
+
+
+class _Sink:
+    """Write-only file object that hands back whatever was written since the last drain."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+class _Echo:
+    """Pseudo-buffer for csv.writer that returns each line instead of storing it."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+    # UTF-8 BOM so Excel detects the encoding of non-ASCII names.
+    yield '\ufeff'
+    for row in rows:
+        yield writer.writerow(row)
+
+
+_XLSX_STATIC_PARTS = {
+    '[Content_Types].xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    '_rels/.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+        'Target="xl/workbook.xml"/>'
+        '</Relationships>'
+    ),
+    'xl/workbook.xml': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Participants" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    'xl/_rels/workbook.xml.rels': (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '</Relationships>'
+    ),
+}
+
+# Control characters other than tab/newline/carriage return are invalid in XML.
+_XML_INVALID = dict.fromkeys(c for c in range(32) if c not in (9, 10, 13))
+
+
+def _xlsx_row(index, cells):
+    xml_cells = ''.join(
+        f'<c t="inlineStr"><is><t xml:space="preserve">'
+        f'{escape(str(value).translate(_XML_INVALID))}</t></is></c>'
+        for value in cells
+    )
+    return f'<row r="{index}">{xml_cells}</row>'
+
+
+def stream_xlsx(rows, batch_size=500):
+    """Yields the bytes of a single-sheet XLSX workbook containing `rows`."""
+    sink = _Sink()
+    with zipfile.ZipFile(sink, mode='w', compression=zipfile.ZIP_DEFLATED) as package:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            package.writestr(name, content)
+        yield sink.drain()
+
+        with package.open('xl/worksheets/sheet1.xml', mode='w', force_zip64=True) as sheet:
+            sheet.write(
+                b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                b'<sheetData>'
+            )
+            batch = []
+            for index, cells in enumerate(rows, start=1):
+                batch.append(_xlsx_row(index, cells))
+                if len(batch) >= batch_size:
+                    sheet.write(''.join(batch).encode('utf-8'))
+                    batch = []
+                    yield sink.drain()
+            sheet.write(''.join(batch).encode('utf-8'))
+            sheet.write(b'</sheetData></worksheet>')
+    yield sink.drain()
@@ -0,0 +1,41 @@
+"""Distribution items shared by the views, exports and management commands."""
+
+# Maps each item key to (flag field, timestamp field, display label).
+ITEM_FIELDS = {
+    'registration_goodies': ('registration_goodies', 'registration_time', 'Registration & Goodies'),
+    'breakfast':            ('breakfast',            'breakfast_time',     'Breakfast'),
+    'lunch':                ('lunch',                'lunch_time',         'Lunch'),
+    'snacks':               ('snacks',               'snacks_time',        'Snacks'),
+    'dinner':               ('dinner',               'dinner_time',        'Dinner'),
+    'midnight_snacks':      ('midnight_snacks',      'midnight_snacks_time', 'Midnight Snacks'),
+}
+
+# Key of each item's counter in the /api/stats/ response.
+STAT_KEYS = {
+    'registration_goodies': 'registration_given',
+    'breakfast':            'breakfast_given',
+    'lunch':                'lunch_given',
+    'snacks':               'snacks_given',
+    'dinner':               'dinner_given',
+    'midnight_snacks':      'midnight_snacks_given',
+}
+
+# Bit of each item in packed item bitmasks (bit 0 = registration_goodies),
+# as stored in Participant.items_mask.
+ITEM_BITS = {key: 1 << i for i, key in enumerate(ITEM_FIELDS)}
+
+ALL_ITEMS_MASK = (1 << len(ITEM_FIELDS)) - 1
+
+
+def masks_with_all(bits):
+    """
+    Every items_mask value that has all of `bits` set. With six items there
+    are only 64 masks, so a bit test becomes an IN (...) lookup that can use
+    the items_mask index.
+    """
+    return [mask for mask in range(ALL_ITEMS_MASK + 1) if mask & bits == bits]
+
+
+def masks_missing_any(bits):
+    """Every items_mask value that lacks at least one of `bits`."""
+    return [mask for mask in range(ALL_ITEMS_MASK + 1) if mask & bits != bits]
@@ -0,0 +1,171 @@
+"""
+In-process broker for the live dashboard feed (/api/stats/live/).
+
+Write paths publish counter deltas (e.g. {"lunch_given": 3}) once their
+transaction commits; each open stream waits on the broker and forwards them
+as server-sent events. The broker also keeps this process's totals: the
+last recount plus every delta published since, so a stream starts from
+totals that match the sequence number it then waits after.
+
+The broker only sees writes made by this process. Streams ask it to check
+the data version (events/dataversion.py) at each heartbeat; the check runs
+at most once per heartbeat for the whole process, and only when the
+version has moved does it recount. Any difference from the tracked totals
+comes from writes this process did not publish, and is published to every
+stream as one more delta.
+"""
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from functools import wraps
+
+from django.db import transaction
+from rest_framework.renderers import BaseRenderer
+
+
+class StatsBroker:
+    """
+    Sequenced, bounded history of counter deltas with blocking waits, plus the
+    totals they add up to.
+
+    Write paths run inside writing(); a recount waits for running writes and
+    holds new ones back, so it never counts a commit whose delta is still
+    to come.
+    """
+
+    def __init__(self, history=1024, drain_timeout=5):
+        self._condition = threading.Condition()
+        self._refresh_lock = threading.Lock()
+        self._events = deque(maxlen=history)
+        self._seq = 0
+        self._writers = 0
+        self._recounting = False
+        self._drain_timeout = drain_timeout
+        self._totals = None
+        self._version = None
+        self._checked_at = None
+
+    @property
+    def seq(self):
+        return self._seq
+
+    def publish(self, delta):
+        with self._condition:
+            self._publish(delta)
+
+    def _publish(self, delta):
+        self._seq += 1
+        self._events.append((self._seq, delta))
+        if self._totals is not None:
+            for key, value in delta.items():
+                self._totals[key] = self._totals.get(key, 0) + value
+        self._condition.notify_all()
+
+    def wait(self, after_seq, timeout):
+        """
+        Blocks for up to `timeout` seconds until events newer than `after_seq`
+        exist. Returns the list of (seq, delta) newer than `after_seq` (empty on
+        timeout), or None if some of them already fell out of the history.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._seq > after_seq, timeout=timeout)
+            if self._seq <= after_seq:
+                return []
+            if self._events[0][0] > after_seq + 1:
+                return None
+            return [event for event in self._events if event[0] > after_seq]
+
+    @contextmanager
+    def writing(self):
+        """Marks a write whose delta is published before the block exits."""
+        with self._condition:
+            self._condition.wait_for(lambda: not self._recounting)
+            self._writers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writers -= 1
+                self._condition.notify_all()
+
+    def refresh(self, current_version, count, max_age):
+        """
+        Returns (seq, totals) as of that sequence number. At most once per
+        `max_age` seconds, checks `current_version()` ((version, settled), see
+        dataversion.py) and, unless it is settled and unchanged since the last
+        recount, recounts with `count()` and publishes any difference.
+        """
+        with self._refresh_lock:
+            if self._totals is None or time.monotonic() - self._checked_at >= max_age:
+                version, settled = current_version()
+                if self._totals is not None and settled and version == self._version:
+                    self._checked_at = time.monotonic()
+                elif self._recount(count):
+                    self._version = version if settled else None
+                    self._checked_at = time.monotonic()
+        with self._condition:
+            return self._seq, dict(self._totals)
+
+    def _recount(self, count):
+        with self._condition:
+            self._recounting = True
+            # Without totals there is nothing to fall back on, so wait it out.
+            timeout = None if self._totals is None else self._drain_timeout
+            if not self._condition.wait_for(lambda: not self._writers, timeout=timeout):
+                # A write is stuck (e.g. on a lock): keep the totals, retry next time.
+                self._recounting = False
+                self._condition.notify_all()
+                return False
+        totals = None
+        try:
+            totals = count()
+        finally:
+            with self._condition:
+                self._recounting = False
+                if totals is not None and self._totals is None:
+                    self._totals = totals
+                elif totals is not None:
+                    delta = {
+                        key: value - self._totals.get(key, 0)
+                        for key, value in totals.items()
+                        if value != self._totals.get(key, 0)
+                    }
+                    if delta:
+                        self._publish(delta)
+                self._condition.notify_all()
+        return True
+
+
+stats_broker = StatsBroker()
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets clients negotiate `Accept: text/event-stream`. The stream itself is a
+    StreamingHttpResponse; this only renders error bodies (e.g. 401) as JSON.
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return b'' if data is None else json.dumps(data).encode('utf-8')
+
+
+def publishes_stats(func):
+    """Runs a write path that calls publish_stats_delta() inside stats_broker.writing()."""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with stats_broker.writing():
+            return func(*args, **kwargs)
+    return wrapper
+
+
+def publish_stats_delta(delta, using=None):
+    """Publishes `delta` to live dashboards once the current transaction commits."""
+    delta = {key: value for key, value in delta.items() if value}
+    if delta:
+        transaction.on_commit(lambda: stats_broker.publish(delta), using=using)
@@ -0,0 +1,322 @@
+"""
+Management command to benchmark the API in-process through the WSGI application.
+
+Requests go through the full Django stack (middleware, token authentication,
+views, database) without a network hop, so results isolate server-side cost.
+Each worker thread has its own database connection; SQL statements are counted
+and timed with a connection execute wrapper.
+
+Usage:
+    python manage.py seed_data --participants 20000 --teams 2000 --seed 1
+    python manage.py bench --requests 5000 --concurrency 8
+    python manage.py bench --mix scan=80,give=20 --output bench.json
+
+Write operations (give, team) change distribution state, so run the benchmark
+against a disposable database.
+"""
+
+import io
+import json
+import logging
+import random
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import django
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.db import connection, connections
+from rest_framework.authtoken.models import Token
+
+from events.items import ITEM_FIELDS
+from events.metrics import QueryTimer
+from events.models import Participant, Team
+
+DEFAULT_MIX = 'scan=50,give=30,team=5,stats=5,teams_stats=5,attendees=5'
+
+# URL path of each item's give_* endpoint.
+GIVE_PATHS = {
+    'registration_goodies': '/api/give-registration/',
+    'breakfast': '/api/give-breakfast/',
+    'lunch': '/api/give-lunch/',
+    'snacks': '/api/give-snacks/',
+    'dinner': '/api/give-dinner/',
+    'midnight_snacks': '/api/give-midnight-snacks/',
+}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class Command(BaseCommand):
+    help = 'Benchmark scan, distribution and read endpoints in-process through the WSGI app.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=2000,
+            help='Total number of measured requests (default: 2000).',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=4,
+            help='Number of worker threads (default: 4).',
+        )
+        parser.add_argument(
+            '--mix',
+            type=str,
+            default=DEFAULT_MIX,
+            help=f'Weighted operation mix (default: {DEFAULT_MIX}). '
+                 f'Operations: scan, give, team, stats, teams_stats, attendees.',
+        )
+        parser.add_argument(
+            '--warmup',
+            type=int,
+            default=50,
+            help='Unmeasured requests sent first to warm caches (default: 50).',
+        )
+        parser.add_argument(
+            '--attendees-query',
+            type=str,
+            default='page_size=100',
+            help='Query string for the attendees operation (default: page_size=100).',
+        )
+        parser.add_argument(
+            '--sample-size',
+            type=int,
+            default=2000,
+            help='Number of UIDs/teams the benchmark draws from (default: 2000).',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1,
+            help='Random seed for the request sequence (default: 1).',
+        )
+        parser.add_argument(
+            '--output',
+            type=str,
+            help='Write the JSON report to this file instead of stdout.',
+        )
+
+    def handle(self, *args, **options):
+        mix = self._parse_mix(options['mix'])
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests and --concurrency must be at least 1.')
+
+        uids = list(
+            Participant.objects.order_by('?').values_list('uid', flat=True)[:options['sample_size']]
+        )
+        team_ids = list(
+            Team.objects.filter(member_count__gt=0)
+            .order_by('?').values_list('team_id', flat=True)[:options['sample_size']]
+        )
+        if not uids:
+            raise CommandError('No participants found; run `manage.py seed_data --participants N` first.')
+        if 'team' in mix and not team_ids:
+            raise CommandError('The mix includes "team" but there are no teams with members.')
+
+        user, created = User.objects.get_or_create(username='bench', defaults={'is_staff': False})
+        if created:
+            user.set_unusable_password()
+            user.save()
+        token, _ = Token.objects.get_or_create(user=user)
+        connections.close_all()
+
+        self.app = get_wsgi_application()
+        self.auth = f'Token {token.key}'
+        self.uids = uids
+        self.team_ids = team_ids
+        self.attendees_query = options['attendees_query']
+
+        rng = random.Random(options['seed'])
+        names, weights = zip(*mix.items())
+        plan = rng.choices(names, weights=weights, k=options['warmup'] + options['requests'])
+        requests = [self._build_request(op, rng) for op in plan]
+        warmup, measured = requests[:options['warmup']], requests[options['warmup']:]
+
+        # Failed requests are counted in the report; don't log a traceback for each.
+        request_logger = logging.getLogger('django.request')
+        previous_level = request_logger.level
+        request_logger.setLevel(logging.CRITICAL)
+        try:
+            self._run(warmup, options['concurrency'])
+            started = time.perf_counter()
+            samples = self._run(measured, options['concurrency'])
+            elapsed = time.perf_counter() - started
+        finally:
+            request_logger.setLevel(previous_level)
+
+        report = self._report(samples, elapsed, options)
+        payload = json.dumps(report, indent=2)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(payload + '\n')
+            self.stdout.write(self.style.SUCCESS(
+                f'{report["total"]["rps"]} req/s over {report["total"]["requests"]} requests; '
+                f'report written to {options["output"]}'
+            ))
+        else:
+            self.stdout.write(payload)
+
+    @staticmethod
+    def _parse_mix(spec):
+        known = {'scan', 'give', 'team', 'stats', 'teams_stats', 'attendees'}
+        mix = {}
+        for part in spec.split(','):
+            name, _, weight = part.strip().partition('=')
+            if name not in known:
+                raise CommandError(f'Unknown operation "{name}" in --mix.')
+            try:
+                mix[name] = float(weight or 1)
+            except ValueError:
+                raise CommandError(f'Invalid weight for "{name}" in --mix.')
+        if not any(w > 0 for w in mix.values()):
+            raise CommandError('--mix needs at least one positive weight.')
+        return mix
+
+    def _build_request(self, op, rng):
+        """Returns (op, method, path, query, json body or None)."""
+        if op == 'scan':
+            return op, 'POST', '/api/scan/', '', {'uid': rng.choice(self.uids)}
+        if op == 'give':
+            item = rng.choice(list(ITEM_FIELDS))
+            return op, 'POST', GIVE_PATHS[item], '', {'uid': rng.choice(self.uids)}
+        if op == 'team':
+            item = rng.choice(list(ITEM_FIELDS))
+            body = {'team_id': rng.choice(self.team_ids), 'item': item}
+            return op, 'POST', '/api/distribute-team/', '', body
+        if op == 'stats':
+            return op, 'GET', '/api/stats/', '', None
+        if op == 'teams_stats':
+            return op, 'GET', '/api/teams/stats/', '', None
+        return op, 'GET', '/api/attendees/', self.attendees_query, None
+
+    def _run(self, requests, concurrency):
+        chunks = [requests[i::concurrency] for i in range(concurrency)]
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = pool.map(self._worker, chunks)
+        return [sample for chunk in results for sample in chunk]
+
+    def _worker(self, requests):
+        counter = QueryTimer()
+        samples = []
+        try:
+            with connection.execute_wrapper(counter):
+                for op, method, path, query, body in requests:
+                    queries_before, sql_before = counter.queries, counter.seconds
+                    start = time.perf_counter()
+                    status = self._call(method, path, query, body)
+                    samples.append((
+                        op,
+                        time.perf_counter() - start,
+                        status,
+                        counter.queries - queries_before,
+                        counter.seconds - sql_before,
+                    ))
+        finally:
+            connections.close_all()
+        return samples
+
+    def _call(self, method, path, query, body):
+        data = json.dumps(body).encode() if body is not None else b''
+        environ = {
+            'REQUEST_METHOD': method,
+            'PATH_INFO': path,
+            'QUERY_STRING': query,
+            'SCRIPT_NAME': '',
+            'SERVER_NAME': 'bench',
+            'SERVER_PORT': '80',
+            'SERVER_PROTOCOL': 'HTTP/1.1',
+            'REMOTE_ADDR': '127.0.0.1',
+            'HTTP_HOST': 'bench',
+            'HTTP_AUTHORIZATION': self.auth,
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(data)),
+            'wsgi.input': io.BytesIO(data),
+            'wsgi.errors': io.StringIO(),
+            'wsgi.url_scheme': 'http',
+            'wsgi.version': (1, 0),
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+        }
+        status_holder = []
+
+        def start_response(status, headers, exc_info=None):
+            status_holder.append(int(status.split(' ', 1)[0]))
+
+        try:
+            response = self.app(environ, start_response)
+            try:
+                for _ in response:
+                    pass
+            finally:
+                if hasattr(response, 'close'):
+                    response.close()
+        except Exception:
+            return 599
+        return status_holder[0] if status_holder else 599
+
+    def _report(self, samples, elapsed, options):
+        by_op = {}
+        for sample in samples:
+            by_op.setdefault(sample[0], []).append(sample)
+
+        def summarize(rows, seconds):
+            latencies = sorted(r[1] * 1000 for r in rows)
+            return {
+                'requests': len(rows),
+                'errors': sum(1 for r in rows if r[2] >= 500),
+                'status_codes': {
+                    str(code): sum(1 for r in rows if r[2] == code)
+                    for code in sorted({r[2] for r in rows})
+                },
+                'rps': round(len(rows) / seconds, 1) if seconds else 0.0,
+                'latency_ms': {
+                    'mean': round(sum(latencies) / len(latencies), 3),
+                    'p50': round(percentile(latencies, 50), 3),
+                    'p95': round(percentile(latencies, 95), 3),
+                    'p99': round(percentile(latencies, 99), 3),
+                    'max': round(latencies[-1], 3),
+                },
+                'queries_per_request': round(sum(r[3] for r in rows) / len(rows), 2),
+                'sql_ms_per_request': round(sum(r[4] for r in rows) * 1000 / len(rows), 3),
+            }
+
+        db = connection.settings_dict
+        return {
+            'meta': {
+                'commit': self._git_commit(),
+                'database': {'vendor': connection.vendor, 'name': str(db['NAME'])},
+                'django': django.get_version(),
+                'debug': settings.DEBUG,
+                'concurrency': options['concurrency'],
+                'mix': options['mix'],
+                'seed': options['seed'],
+                'participants_sampled': len(self.uids),
+                'elapsed_s': round(elapsed, 3),
+            },
+            'total': summarize(samples, elapsed),
+            'endpoints': {op: summarize(rows, elapsed) for op, rows in sorted(by_op.items())},
+        }
+
+    @staticmethod
+    def _git_commit():
+        try:
+            return subprocess.run(
+                ['git', 'rev-parse', '--short', 'HEAD'],
+                capture_output=True, text=True, check=True, cwd=settings.BASE_DIR,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,86 @@
+"""
+Management command to compare the two ways of rendering participant lists:
+DRF serializers + JSONRenderer, and the hand-written row encoders
+(events/encoders.py) + ORJSONRenderer.
+
+Rows are loaded once (with their teams) and rendered repeatedly, so the
+timings cover only serialization, the part that grows with list size.
+
+Usage:
+    python manage.py seed_data --participants 10000 --teams 1000 --seed 1
+    python manage.py bench_render --rows 10000
+    python manage.py bench_render --rows 10000 --repeat 10 --output render.json
+"""
+
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from events.encoders import encode_participants, encode_team_members
+from events.models import Participant
+from events.renderers import ORJSONRenderer, orjson
+from events.serializers import ParticipantSerializer, TeamMemberSerializer
+
+
+class Command(BaseCommand):
+    help = 'Compare serializer and row-encoder rendering of large attendee lists.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=10000,
+                            help='Number of participants to render (default: 10000).')
+        parser.add_argument('--repeat', type=int, default=5,
+                            help='Renders per variant; the fastest is reported (default: 5).')
+        parser.add_argument('--output', type=str,
+                            help='Write the JSON results to this file.')
+
+    def handle(self, *args, **options):
+        rows = list(Participant.objects.select_related('team').order_by('pk')[:options['rows']])
+        if not rows:
+            raise CommandError('No participants to render; run seed_data first.')
+
+        variants = {
+            'attendees': (
+                lambda: JSONRenderer().render({'attendees': ParticipantSerializer(rows, many=True).data}),
+                lambda: ORJSONRenderer().render({'attendees': encode_participants(rows)}),
+            ),
+            'team_members': (
+                lambda: JSONRenderer().render({'members': TeamMemberSerializer(rows, many=True).data}),
+                lambda: ORJSONRenderer().render({'members': encode_team_members(rows)}),
+            ),
+        }
+
+        results = {
+            'meta': {'rows': len(rows), 'repeat': options['repeat'], 'orjson': orjson is not None},
+        }
+        for name, (baseline, fast) in variants.items():
+            if baseline() != fast():
+                raise CommandError(f'{name}: encoder output differs from the serializer output.')
+            baseline_s = self._best(baseline, options['repeat'])
+            fast_s = self._best(fast, options['repeat'])
+            results[name] = {
+                'serializer_ms': round(baseline_s * 1000, 1),
+                'encoder_ms': round(fast_s * 1000, 1),
+                'speedup': round(baseline_s / fast_s, 1),
+            }
+            self.stdout.write(
+                f'{name:<13} serializer {results[name]["serializer_ms"]:>8} ms  '
+                f'encoder {results[name]["encoder_ms"]:>8} ms  '
+                f'x{results[name]["speedup"]}'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Results written to {options["output"]}'))
+
+    @staticmethod
+    def _best(render, repeat):
+        best = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            render()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,132 @@
+"""
+Management command to compare SQLite's default configuration with the
+production profile (SQLITE_PRODUCTION: WAL, synchronous=NORMAL, busy timeout,
+persistent connections) under concurrent writes.
+
+Each profile runs `manage.py bench` in a subprocess, because database
+settings are fixed at startup. Both runs use a fresh, migrated copy of the
+same database, so the source is never modified.
+
+Usage:
+    python manage.py seed_data --participants 20000 --teams 2000 --seed 1
+    python manage.py bench_sqlite --requests 3000 --concurrency 8
+    python manage.py bench_sqlite --mix give=80,scan=20 --output sqlite.json
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+DEFAULT_MIX = 'give=60,team=10,scan=10,stats=10,attendees=10'
+
+WRITE_OPS = ('give', 'team')
+
+PROFILES = {
+    # Rollback journal, synchronous=FULL, no persistent connections.
+    'default': {'SQLITE_PRODUCTION': '0'},
+    'production': {'SQLITE_PRODUCTION': '1'},
+}
+
+
+class Command(BaseCommand):
+    help = 'Compare write throughput and lock errors of the default and production SQLite profiles.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000,
+                            help='Measured requests per profile (default: 2000).')
+        parser.add_argument('--concurrency', type=int, default=8,
+                            help='Number of worker threads (default: 8).')
+        parser.add_argument('--mix', type=str, default=DEFAULT_MIX,
+                            help=f'Operation mix passed to bench (default: {DEFAULT_MIX}).')
+        parser.add_argument('--seed', type=int, default=1,
+                            help='Random seed for the request sequence (default: 1).')
+        parser.add_argument('--output', type=str,
+                            help='Write the JSON comparison to this file.')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'sqlite':
+            raise CommandError('bench_sqlite needs the default database to be SQLite.')
+        source = str(connection.settings_dict['NAME'])
+        connection.close()
+
+        results = {}
+        with tempfile.TemporaryDirectory() as workdir:
+            for profile, env in PROFILES.items():
+                db_path = os.path.join(workdir, f'{profile}.sqlite3')
+                self._copy_database(source, db_path)
+                report_path = os.path.join(workdir, f'{profile}.json')
+                self._run_bench(db_path, report_path, env, options)
+                with open(report_path, encoding='utf-8') as f:
+                    results[profile] = self._summarize(json.load(f))
+
+        for profile, summary in results.items():
+            self.stdout.write(
+                f'{profile:<11} {summary["rps"]:>8} req/s  '
+                f'{summary["writes_per_s"]:>8} writes/s  '
+                f'lock errors {summary["errors"]}/{summary["requests"]} '
+                f'({summary["error_rate"]:.2%})  '
+                f'write p95 {summary["write_p95_ms"]} ms'
+            )
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as f:
+                f.write(json.dumps(results, indent=2) + '\n')
+            self.stdout.write(self.style.SUCCESS(f'Comparison written to {options["output"]}'))
+
+    @staticmethod
+    def _copy_database(source, target):
+        """Copies the database with the backup API and resets it to the rollback journal."""
+        src = sqlite3.connect(source)
+        dst = sqlite3.connect(target)
+        try:
+            src.backup(dst)
+            # journal_mode=WAL is persistent; the baseline must start from the default.
+            dst.execute('PRAGMA journal_mode = DELETE')
+        finally:
+            dst.close()
+            src.close()
+
+    def _run_bench(self, db_path, report_path, profile_env, options):
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{db_path}', **profile_env)
+        env.pop('DATABASE_REPLICA_URL', None)
+        manage = str(settings.BASE_DIR / 'manage.py')
+        self._run([sys.executable, manage, 'migrate', '--noinput', '-v', '0'], env)
+        self._run([
+            sys.executable, manage, 'bench',
+            '--requests', str(options['requests']),
+            '--concurrency', str(options['concurrency']),
+            '--mix', options['mix'],
+            '--seed', str(options['seed']),
+            '--output', report_path,
+        ], env)
+
+    @staticmethod
+    def _run(command, env):
+        completed = subprocess.run(command, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise CommandError(f'{command[2]} failed:\n{completed.stderr}')
+
+    @staticmethod
+    def _summarize(report):
+        total = report['total']
+        elapsed = report['meta']['elapsed_s']
+        writes = [report['endpoints'][op] for op in WRITE_OPS if op in report['endpoints']]
+        write_ok = sum(
+            count for w in writes for code, count in w['status_codes'].items() if int(code) < 500
+        )
+        return {
+            'requests': total['requests'],
+            'errors': total['errors'],
+            'error_rate': total['errors'] / total['requests'] if total['requests'] else 0.0,
+            'rps': total['rps'],
+            'writes_per_s': round(write_ok / elapsed, 1) if elapsed else 0.0,
+            'write_p95_ms': max((w['latency_ms']['p95'] for w in writes), default=0.0),
+            'bench': report,
+        }
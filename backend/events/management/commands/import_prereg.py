@@ -6,17 +6,25 @@ CSV format (with header row):
 
 Usage:
     python manage.py import_prereg path/to/members.csv
+    python manage.py import_prereg path/to/members.csv --bulk --chunk-size 2000
 
 Example CSV:
     team_id,team_name,team_color,member_name,college
     team_phoenix,Team Phoenix,#FF6B6B,Rahul Kumar,MRU
     team_phoenix,Team Phoenix,#FF6B6B,Priya Sharma,MRU
     team_titan,Team Titan,#448AFF,Amit Patel,IIT Delhi
+
+--bulk streams the CSV in chunks and writes each chunk with a handful of
+statements (bulk_create with ignore_conflicts for teams and member slots),
+committing per chunk so the SQLite write lock is released between chunks.
 """
 
 import csv
 import os
+from itertools import islice
+
 from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from events.models import Team, PreRegisteredMember
 
 
@@ -34,6 +42,17 @@ class Command(BaseCommand):
             action='store_true',
             help='Validate and preview without saving to the database.',
         )
+        parser.add_argument(
+            '--bulk',
+            action='store_true',
+            help='Import in chunks with bulk inserts and compact per-chunk progress output.',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Rows per transaction in --bulk mode (default: 1000).',
+        )
 
     def handle(self, *args, **options):
         csv_path = options['csv_file']
@@ -41,11 +60,13 @@ class Command(BaseCommand):
 
         if not os.path.exists(csv_path):
             raise CommandError(f'File not found: {csv_path}')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size must be at least 1.')
 
-        teams_created = 0
-        members_created = 0
-        skipped = 0
-        errors = []
+        self.teams_created = 0
+        self.members_created = 0
+        self.skipped = 0
+        self.errors = []
 
         with open(csv_path, newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
@@ -57,53 +78,16 @@ class Command(BaseCommand):
                     f'Got: {", ".join(reader.fieldnames or [])}'
                 )
 
-            for line_num, row in enumerate(reader, start=2):  # start=2 to account for header
-                team_id = row['team_id'].strip()
-                team_name = row['team_name'].strip()
-                team_color = row['team_color'].strip() or '#00E676'
-                member_name = row['member_name'].strip()
-                college = row['college'].strip()
-
-                if not team_id or not team_name or not member_name or not college:
-                    errors.append(f'Line {line_num}: Missing required fields — skipping.')
-                    skipped += 1
-                    continue
-
-                if dry_run:
-                    self.stdout.write(
-                        f'[DRY RUN] Line {line_num}: Team="{team_name}" ({team_id}), '
-                        f'Member="{member_name}", College="{college}"'
-                    )
-                    continue
-
-                # Get or create the team
-                team, team_was_created = Team.objects.get_or_create(
-                    team_id=team_id,
-                    defaults={'team_name': team_name, 'team_color': team_color},
-                )
-                if team_was_created:
-                    teams_created += 1
-                    self.stdout.write(self.style.SUCCESS(f'  Created team: {team_name} ({team_id})'))
-
-                # Create the pre-registered member slot (idempotent)
-                _, member_was_created = PreRegisteredMember.objects.get_or_create(
-                    team=team,
-                    name=member_name,
-                    defaults={'college': college},
-                )
-                if member_was_created:
-                    members_created += 1
-                    self.stdout.write(f'    Added member: {member_name} ({college})')
-                else:
-                    skipped += 1
-                    self.stdout.write(
-                        self.style.WARNING(f'    Skipped (already exists): {member_name}')
-                    )
+            rows = self._clean_rows(reader)
+            if options['bulk']:
+                self._import_bulk(rows, options['chunk_size'], dry_run)
+            else:
+                self._import_rows(rows, dry_run)
 
         # Summary
-        if errors:
+        if self.errors:
             self.stderr.write('\nErrors encountered:')
-            for err in errors:
+            for err in self.errors:
                 self.stderr.write(f'  {err}')
 
         if dry_run:
@@ -111,7 +95,118 @@ class Command(BaseCommand):
         else:
             self.stdout.write(
                 self.style.SUCCESS(
-                    f'\nImport complete: {teams_created} team(s) created, '
-                    f'{members_created} member slot(s) added, {skipped} skipped.'
+                    f'\nImport complete: {self.teams_created} team(s) created, '
+                    f'{self.members_created} member slot(s) added, {self.skipped} skipped.'
+                )
+            )
+
+    def _clean_rows(self, reader):
+        """Yields (line_num, team_id, team_name, team_color, member_name, college) for valid rows."""
+        for line_num, row in enumerate(reader, start=2):  # start=2 to account for header
+            team_id = row['team_id'].strip()
+            team_name = row['team_name'].strip()
+            team_color = row['team_color'].strip() or '#00E676'
+            member_name = row['member_name'].strip()
+            college = row['college'].strip()
+
+            if not team_id or not team_name or not member_name or not college:
+                self.errors.append(f'Line {line_num}: Missing required fields — skipping.')
+                self.skipped += 1
+                continue
+
+            yield line_num, team_id, team_name, team_color, member_name, college
+
+    def _import_rows(self, rows, dry_run):
+        for line_num, team_id, team_name, team_color, member_name, college in rows:
+            if dry_run:
+                self.stdout.write(
+                    f'[DRY RUN] Line {line_num}: Team="{team_name}" ({team_id}), '
+                    f'Member="{member_name}", College="{college}"'
+                )
+                continue
+
+            # Get or create the team
+            team, team_was_created = Team.objects.get_or_create(
+                team_id=team_id,
+                defaults={'team_name': team_name, 'team_color': team_color},
+            )
+            if team_was_created:
+                self.teams_created += 1
+                self.stdout.write(self.style.SUCCESS(f'  Created team: {team_name} ({team_id})'))
+
+            # Create the pre-registered member slot (idempotent)
+            _, member_was_created = PreRegisteredMember.objects.get_or_create(
+                team=team,
+                name=member_name,
+                defaults={'college': college},
+            )
+            if member_was_created:
+                self.members_created += 1
+                self.stdout.write(f'    Added member: {member_name} ({college})')
+            else:
+                self.skipped += 1
+                self.stdout.write(
+                    self.style.WARNING(f'    Skipped (already exists): {member_name}')
+                )
+
+    def _import_bulk(self, rows, chunk_size, dry_run):
+        # team_id -> pk for every team already in the database.
+        team_pks = dict(Team.objects.values_list('team_id', 'pk'))
+        chunk_num = 0
+
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            chunk_num += 1
+
+            new_teams = {}
+            for _, team_id, team_name, team_color, _, _ in chunk:
+                if team_id not in team_pks and team_id not in new_teams:
+                    new_teams[team_id] = Team(team_id=team_id, team_name=team_name, team_color=team_color)
+
+            with transaction.atomic():
+                if new_teams and not dry_run:
+                    Team.objects.bulk_create(new_teams.values(), ignore_conflicts=True)
+                    team_pks.update(
+                        Team.objects.filter(team_id__in=new_teams).values_list('team_id', 'pk')
+                    )
+                elif new_teams:
+                    # Dry run: stand in the team_id for the pk the team would get.
+                    team_pks.update((team_id, team_id) for team_id in new_teams)
+
+                chunk_team_pks = {
+                    team_pks[row[1]] for row in chunk if isinstance(team_pks[row[1]], int)
+                }
+                existing = set(
+                    PreRegisteredMember.objects
+                    .filter(team_id__in=chunk_team_pks)
+                    .values_list('team_id', 'name')
                 )
+
+                new_members = []
+                chunk_skipped = 0
+                for _, team_id, _, _, member_name, college in chunk:
+                    key = (team_pks[team_id], member_name)
+                    if key in existing:
+                        chunk_skipped += 1
+                        continue
+                    existing.add(key)
+                    new_members.append(
+                        PreRegisteredMember(team_id=key[0], name=member_name, college=college)
+                    )
+
+                if not dry_run:
+                    PreRegisteredMember.objects.bulk_create(
+                        new_members, batch_size=500, ignore_conflicts=True,
+                    )
+
+            self.teams_created += len(new_teams)
+            self.members_created += len(new_members)
+            self.skipped += chunk_skipped
+            prefix = '[DRY RUN] ' if dry_run else ''
+            self.stdout.write(
+                f'{prefix}Chunk {chunk_num} (lines {chunk[0][0]}-{chunk[-1][0]}): '
+                f'{len(new_teams)} team(s), {len(new_members)} member slot(s), '
+                f'{chunk_skipped} skipped.'
             )
@@ -0,0 +1,23 @@
+"""
+Management command to recompute the denormalized Team.member_count column.
+
+Participant.save() and a post_delete receiver (events/signals.py) keep the
+counter up to date, but bulk operations (queryset.update(), bulk_create(),
+raw SQL) bypass them.
+
+Usage:
+    python manage.py rebuild_member_counts
+"""
+
+from django.core.management.base import BaseCommand
+from events.models import Team
+
+
+class Command(BaseCommand):
+    help = 'Recompute Team.member_count from the Participant table.'
+
+    def handle(self, *args, **options):
+        updated = Team.rebuild_member_counts()
+        self.stdout.write(self.style.SUCCESS(
+            f'Member counts rebuilt: {updated} team(s) corrected.'
+        ))
@@ -1,8 +1,28 @@
+"""
+Management command to seed the database with an admin user and sample data.
+
+Usage:
+    python manage.py seed_data --count 20
+    python manage.py seed_data --participants 200000 --teams 20000 --prereg-ratio 1.1 --seed 42
+
+The second form generates a full, reproducible event for capacity testing:
+teams, pre-registered slots (some left unlinked), participants linked to those
+slots, solo participants, and distribution timestamps spread over the 48-hour
+schedule up to --elapsed-hours. Everything is written with bulk_create.
+"""
+
+import math
 import random
-from django.core.management.base import BaseCommand
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
 from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
 from rest_framework.authtoken.models import Token
-from events.models import Participant
+from events.items import ITEM_FIELDS
+from events.models import Participant, PreRegisteredMember, Team
 
 
 # Sample data for realistic participants
@@ -28,9 +48,22 @@ COLLEGES = [
 ]
 
 
-def generate_uid():
+TEAM_WORDS = [
+    'Phoenix', 'Titan', 'Nova', 'Falcon', 'Cipher', 'Vortex', 'Nebula',
+    'Quantum', 'Raptor', 'Spectre', 'Zenith', 'Orbit', 'Pulse', 'Vector',
+]
+
+TEAM_COLORS = [
+    '#FF6B6B', '#448AFF', '#00E676', '#FFD740', '#E040FB', '#18FFFF', '#FF9100',
+]
+
+# Share of participants who show up for an item by the end of its window.
+TURNOUT = 0.92
+
+
+def generate_uid(rng=random):
     """Generate a realistic 7-byte NFC UID as uppercase hex."""
-    return ''.join(f'{random.randint(0, 255):02X}' for _ in range(7))
+    return ''.join(f'{rng.randint(0, 255):02X}' for _ in range(7))
 
 
 class Command(BaseCommand):
@@ -43,6 +76,54 @@ class Command(BaseCommand):
             default=20,
             help='Number of participants to create (default: 20)',
         )
+        parser.add_argument(
+            '--participants',
+            type=int,
+            help='Generate a full event with this many participants (bulk mode).',
+        )
+        parser.add_argument(
+            '--teams',
+            type=int,
+            default=0,
+            help='Number of teams in bulk mode (default: 0, everyone solo).',
+        )
+        parser.add_argument(
+            '--prereg-ratio',
+            type=float,
+            default=1.1,
+            help='Pre-registered slots per team participant; slots beyond the '
+                 'team size stay unlinked (default: 1.1).',
+        )
+        parser.add_argument(
+            '--solo-ratio',
+            type=float,
+            default=0.05,
+            help='Share of participants without a team when --teams > 0 (default: 0.05).',
+        )
+        parser.add_argument(
+            '--elapsed-hours',
+            type=float,
+            default=24.0,
+            help='Hours of the 48-hour schedule that have already run; items are '
+                 'collected up to this point (default: 24).',
+        )
+        parser.add_argument(
+            '--event-start',
+            type=str,
+            help='Event start date YYYY-MM-DD (default: today).',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            default=1,
+            help='Random seed for reproducible bulk data (default: 1).',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=5000,
+            help='Rows per bulk insert (default: 5000).',
+        )
 
     def handle(self, *args, **options):
         count = options['count']
@@ -93,6 +174,10 @@ class Command(BaseCommand):
             f'Counter auth token: {counter_token.key}'
         ))
 
+        if options['participants'] is not None:
+            self._seed_event(options)
+            return
+
         # Create sample participants
         existing = Participant.objects.count()
         created_count = 0
@@ -128,3 +213,163 @@ class Command(BaseCommand):
                 f'  UID: {p.uid}  |  {p.name}  |  {p.college}'
             )
         self.stdout.write('-' * 60)
+
+    # ---------- Bulk event generator ----------
+
+    def _seed_event(self, options):
+        total = options['participants']
+        n_teams = options['teams']
+        batch_size = options['batch_size']
+        if total < 0 or n_teams < 0 or batch_size < 1:
+            raise CommandError('--participants, --teams and --batch-size must be positive.')
+        if options['prereg_ratio'] < 1:
+            raise CommandError('--prereg-ratio must be at least 1.0.')
+        if n_teams and total < n_teams:
+            raise CommandError('--participants must be at least --teams.')
+
+        rng = random.Random(options['seed'])
+        tz = timezone.get_current_timezone()
+        if options['event_start']:
+            try:
+                start_date = datetime.strptime(options['event_start'], '%Y-%m-%d').date()
+            except ValueError:
+                raise CommandError('--event-start must be YYYY-MM-DD.')
+        else:
+            start_date = timezone.localdate()
+        event_start = timezone.make_aware(datetime.combine(start_date, time.min), tz)
+        cutoff = event_start + timedelta(hours=options['elapsed_hours'])
+        windows = self._item_windows(event_start, cutoff)
+
+        solo_total = total if not n_teams else int(total * options['solo_ratio'])
+        if total - solo_total < n_teams:
+            raise CommandError(
+                f'Only {total - solo_total} participant(s) left for {n_teams} team(s) after the '
+                'solo share; lower --teams or --solo-ratio.'
+            )
+        team_sizes = self._team_sizes(rng, total - solo_total, n_teams)
+        prefix = f'seed{options["seed"]}_'
+        if Team.objects.filter(team_id__startswith=prefix).exists():
+            raise CommandError(
+                f'Teams with prefix "{prefix}" already exist; use a different --seed.'
+            )
+
+        uids = set(Participant.objects.values_list('uid', flat=True))
+
+        def new_uid():
+            while True:
+                uid = generate_uid(rng)
+                if uid not in uids:
+                    uids.add(uid)
+                    return uid
+
+        with transaction.atomic():
+            teams = Team.objects.bulk_create(
+                [
+                    Team(
+                        team_id=f'{prefix}{i:06}',
+                        team_name=f'Team {rng.choice(TEAM_WORDS)} {i}',
+                        team_color=rng.choice(TEAM_COLORS),
+                        member_count=size,
+                    )
+                    for i, size in enumerate(team_sizes)
+                ],
+                batch_size=batch_size,
+            )
+
+            slots, participants = [], []
+            slot_count = linked = 0
+            for team, size in zip(teams, team_sizes):
+                names = set()
+                for position in range(math.ceil(size * options['prereg_ratio'])):
+                    name = self._unique_name(rng, names)
+                    college = rng.choice(COLLEGES)
+                    is_linked = position < size
+                    slots.append(PreRegisteredMember(
+                        team=team, name=name, college=college, is_linked=is_linked,
+                    ))
+                    if is_linked:
+                        participants.append(self._participant(
+                            rng, new_uid(), name, college, team, windows,
+                        ))
+                if len(slots) >= batch_size:
+                    slot_count += len(PreRegisteredMember.objects.bulk_create(slots, batch_size=batch_size))
+                    slots = []
+                if len(participants) >= batch_size:
+                    linked += len(Participant.objects.bulk_create(participants, batch_size=batch_size))
+                    participants = []
+
+            for _ in range(solo_total):
+                participants.append(self._participant(
+                    rng, new_uid(), self._unique_name(rng, set()), rng.choice(COLLEGES), None, windows,
+                ))
+                if len(participants) >= batch_size:
+                    linked += len(Participant.objects.bulk_create(participants, batch_size=batch_size))
+                    participants = []
+
+            slot_count += len(PreRegisteredMember.objects.bulk_create(slots, batch_size=batch_size))
+            linked += len(Participant.objects.bulk_create(participants, batch_size=batch_size))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Seeded {len(teams)} team(s), {slot_count} pre-registered slot(s), '
+            f'{linked} participant(s) ({solo_total} solo) with seed {options["seed"]}; '
+            f'distribution simulated up to {cutoff:%Y-%m-%d %H:%M}.'
+        ))
+
+    @staticmethod
+    def _team_sizes(rng, members, n_teams):
+        """
+        Splits `members` (at least `n_teams`) over `n_teams` teams with a
+        little variation in size.
+        """
+        if not n_teams:
+            return []
+        sizes = [members // n_teams] * n_teams
+        for i in rng.sample(range(n_teams), members % n_teams):
+            sizes[i] += 1
+        # Shuffle members between random pairs, keeping every team non-empty.
+        for _ in range(n_teams // 2):
+            a, b = rng.randrange(n_teams), rng.randrange(n_teams)
+            if sizes[a] > 2:
+                sizes[a] -= 1
+                sizes[b] += 1
+        return sizes
+
+    @staticmethod
+    def _unique_name(rng, taken):
+        name = f'{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}'
+        suffix = 2
+        candidate = name
+        while candidate in taken:
+            candidate = f'{name} {suffix}'
+            suffix += 1
+        taken.add(candidate)
+        return candidate
+
+    @staticmethod
+    def _item_windows(event_start, cutoff):
+        """
+        Returns {item: (start, until, end)} for items whose window (from
+        settings.DISTRIBUTION_SCHEDULE) opened before `cutoff`.
+        """
+        windows = {}
+        for item, ((sd, sh, sm), (ed, eh, em), *_) in settings.DISTRIBUTION_SCHEDULE.items():
+            start = event_start + timedelta(days=sd, hours=sh, minutes=sm)
+            end = event_start + timedelta(days=ed, hours=eh, minutes=em)
+            if start < cutoff:
+                windows[item] = (start, min(end, cutoff), end)
+        return windows
+
+    @staticmethod
+    def _participant(rng, uid, name, college, team, windows):
+        participant = Participant(uid=uid, name=name, college=college, team=team)
+        for item, (start, until, end) in windows.items():
+            field, time_field, _ = ITEM_FIELDS[item]
+            # Turnout grows linearly over the window; only the elapsed part has happened.
+            elapsed_share = (until - start) / (end - start)
+            if rng.random() < TURNOUT * elapsed_share:
+                offset = rng.random() * (until - start).total_seconds()
+                setattr(participant, field, True)
+                setattr(participant, time_field, start + timedelta(seconds=offset))
+        # bulk_create() bypasses save().
+        participant.sync_items_mask()
+        return participant
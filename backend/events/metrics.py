@@ -0,0 +1,234 @@
+"""
+Per-process request, SQL and distribution metrics in Prometheus text format.
+
+Each thread records into its own shard, so the request path never takes a
+lock; /api/metrics/ sums the shards when it is scraped. The shard of a
+thread that exits is folded into a shared total. Counters are per
+worker process and reset on restart, which Prometheus' rate() handles.
+"""
+
+import bisect
+import threading
+import time
+import weakref
+from collections import defaultdict
+from contextlib import ExitStack
+
+from django.db import connections
+
+from .items import ITEM_FIELDS
+
+# Upper bounds (seconds) of the request latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Shard:
+    """One thread's counters. Only its owning thread writes to it."""
+
+    def __init__(self, bucket_count):
+        self.requests = defaultdict(int)        # (view, method, status) -> count
+        self.latency = defaultdict(lambda: [0] * (bucket_count + 2))  # view -> buckets.., +Inf, sum
+        self.queries = defaultdict(int)         # view -> SQL statements
+        self.query_seconds = defaultdict(float)  # view -> SQL time
+        self.distributions = defaultdict(int)   # (item, result) -> count
+
+    def merge(self, other):
+        """Adds the counters of `other`, which its thread may still be writing."""
+        for key, value in dict(other.requests).items():
+            self.requests[key] += value
+        for view, histogram in dict(other.latency).items():
+            total = self.latency[view]
+            for i, value in enumerate(list(histogram)):
+                total[i] += value
+        for view, value in dict(other.queries).items():
+            self.queries[view] += value
+        for view, value in dict(other.query_seconds).items():
+            self.query_seconds[view] += value
+        for key, value in dict(other.distributions).items():
+            self.distributions[key] += value
+
+
+class _ShardOwner:
+    """Held only by a thread's local storage, so it is freed when the thread exits."""
+
+    __slots__ = ('shard', '__weakref__')
+
+    def __init__(self, shard):
+        self.shard = shard
+
+
+class MetricsRegistry:
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._local = threading.local()
+        self._shards = []
+        self._retired = _Shard(len(buckets))
+        self._shards_lock = threading.Lock()
+
+    def _shard(self):
+        owner = getattr(self._local, 'owner', None)
+        if owner is None:
+            owner = self._local.owner = _ShardOwner(_Shard(len(self.buckets)))
+            # When the thread exits, fold its shard into the retired totals so
+            # that servers which replace threads keep a bounded shard list.
+            weakref.finalize(owner, self._retire, owner.shard)
+            # Taken once per thread, not per request.
+            with self._shards_lock:
+                self._shards.append(owner.shard)
+        return owner.shard
+
+    def _retire(self, shard):
+        with self._shards_lock:
+            # Absent after reset(): its counts were discarded.
+            if any(live is shard for live in self._shards):
+                self._shards = [live for live in self._shards if live is not shard]
+                self._retired.merge(shard)
+
+    def observe_request(self, view, method, status, seconds, queries, query_seconds):
+        shard = self._shard()
+        shard.requests[(view, method, status)] += 1
+        histogram = shard.latency[view]
+        histogram[bisect.bisect_left(self.buckets, seconds)] += 1
+        histogram[-1] += seconds
+        shard.queries[view] += queries
+        shard.query_seconds[view] += query_seconds
+
+    def record_distribution(self, item, result, count=1):
+        if count:
+            self._shard().distributions[(item, result)] += count
+
+    def reset(self):
+        with self._shards_lock:
+            self._shards = []
+            self._retired = _Shard(len(self.buckets))
+        self._local = threading.local()
+
+    def snapshot(self):
+        """Returns the summed counters of every thread, live or exited."""
+        total = _Shard(len(self.buckets))
+        # Held so that a shard retired meanwhile is not counted twice.
+        with self._shards_lock:
+            total.merge(self._retired)
+            for shard in self._shards:
+                total.merge(shard)
+        return {
+            'requests': total.requests,
+            'latency': dict(total.latency),
+            'queries': total.queries,
+            'query_seconds': total.query_seconds,
+            'distributions': total.distributions,
+        }
+
+
+registry = MetricsRegistry()
+
+
+class QueryTimer:
+    """Connection execute wrapper that counts and times SQL statements."""
+
+    def __init__(self):
+        self.queries = 0
+        self.seconds = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.seconds += time.perf_counter() - start
+            self.queries += 1
+
+
+class MetricsMiddleware:
+    """
+    Records count, latency and SQL statements/time of every request, labelled
+    by URL name. Latency of streaming responses covers the view only, not the
+    time spent sending the body.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        timer = QueryTimer()
+        start = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(timer))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - start
+
+        match = request.resolver_match
+        view = (match.url_name or match.view_name) if match else 'unmatched'
+        registry.observe_request(
+            view, request.method, response.status_code, elapsed, timer.queries, timer.seconds,
+        )
+        return response
+
+
+def _labels(**labels):
+    def escape(value):
+        return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    return '{' + ','.join(f'{key}="{escape(value)}"' for key, value in labels.items()) + '}'
+
+
+def _format_float(value):
+    return repr(float(value)) if value != float('inf') else '+Inf'
+
+
+def render_prometheus(caches=None):
+    """Renders the registry (plus `caches`: {name: LRUTTLCache}) as Prometheus text."""
+    data = registry.snapshot()
+    lines = []
+
+    def family(name, kind, help_text):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+
+    family('nfc_http_requests_total', 'counter', 'HTTP requests by view, method and status.')
+    for (view, method, status), value in sorted(data['requests'].items()):
+        lines.append(f'nfc_http_requests_total{_labels(view=view, method=method, status=status)} {value}')
+
+    family('nfc_http_request_duration_seconds', 'histogram', 'Time spent in the view stack.')
+    for view, histogram in sorted(data['latency'].items()):
+        cumulative = 0
+        for bound, count in zip(registry.buckets + (float('inf'),), histogram[:-1]):
+            cumulative += count
+            labels = _labels(view=view, le=_format_float(bound))
+            lines.append(f'nfc_http_request_duration_seconds_bucket{labels} {cumulative}')
+        lines.append(f'nfc_http_request_duration_seconds_sum{_labels(view=view)} {_format_float(histogram[-1])}')
+        lines.append(f'nfc_http_request_duration_seconds_count{_labels(view=view)} {cumulative}')
+
+    family('nfc_db_queries_total', 'counter', 'SQL statements executed, by view.')
+    for view, value in sorted(data['queries'].items()):
+        lines.append(f'nfc_db_queries_total{_labels(view=view)} {value}')
+
+    family('nfc_db_query_seconds_total', 'counter', 'Time spent executing SQL, by view.')
+    for view, value in sorted(data['query_seconds'].items()):
+        lines.append(f'nfc_db_query_seconds_total{_labels(view=view)} {_format_float(value)}')
+
+    family('nfc_distributions_total', 'counter', 'Distribution attempts by item and result.')
+    for item in ITEM_FIELDS:
+        for result in ('success', 'already_collected'):
+            value = data['distributions'].get((item, result), 0)
+            lines.append(f'nfc_distributions_total{_labels(item=item, result=result)} {value}')
+
+    cache_stats = {name: cache.stats() for name, cache in (caches or {}).items()}
+    if cache_stats:
+        family('nfc_cache_requests_total', 'counter', 'In-process cache lookups by result.')
+        for name, stats in cache_stats.items():
+            lines.append(f'nfc_cache_requests_total{_labels(cache=name, result="hit")} {stats["hits"]}')
+            lines.append(f'nfc_cache_requests_total{_labels(cache=name, result="miss")} {stats["misses"]}')
+        family('nfc_cache_evictions_total', 'counter', 'In-process cache LRU evictions.')
+        for name, stats in cache_stats.items():
+            lines.append(f'nfc_cache_evictions_total{_labels(cache=name)} {stats["evictions"]}')
+        family('nfc_cache_entries', 'gauge', 'Entries currently held by the in-process cache.')
+        for name, stats in cache_stats.items():
+            lines.append(f'nfc_cache_entries{_labels(cache=name)} {stats["size"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def record_distribution(item, result, count=1):
+    """Counts `count` distribution attempts of `item` ending in `result`."""
+    registry.record_distribution(item, result, count)
@@ -0,0 +1,32 @@
+from django.db import migrations, models
+
+
+def populate_member_counts(apps, schema_editor):
+    Team = apps.get_model('events', 'Team')
+    Participant = apps.get_model('events', 'Participant')
+    db = schema_editor.connection.alias
+    counts = (
+        Participant.objects.using(db)
+        .filter(team__isnull=False)
+        .values_list('team')
+        .annotate(n=models.Count('pk'))
+        .order_by()
+    )
+    for team_pk, n in counts:
+        Team.objects.using(db).filter(pk=team_pk).update(member_count=n)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_pre_registered_member'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='team',
+            name='member_count',
+            field=models.PositiveIntegerField(default=0, help_text='Denormalized number of participants in this team. Maintained by Participant.save() and a post_delete receiver; rebuild with `manage.py rebuild_member_counts`.'),
+        ),
+        migrations.RunPython(populate_member_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,28 @@
+from django.db import migrations, models
+
+
+def create_singleton(apps, schema_editor):
+    DataVersion = apps.get_model('events', 'DataVersion')
+    DataVersion.objects.using(schema_editor.connection.alias).get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DataVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+            options={
+                'verbose_name': 'Data Version',
+                'verbose_name_plural': 'Data Version',
+            },
+        ),
+        migrations.RunPython(create_singleton, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+from django.db import migrations, models
+from django.db.models import F
+
+# Item flag fields in bit order, as of this migration.
+ITEM_FLAGS = ('registration_goodies', 'breakfast', 'lunch', 'snacks', 'dinner', 'midnight_snacks')
+
+
+def backfill_items_mask(apps, schema_editor):
+    # One set-based UPDATE per item instead of saving every row.
+    Participant = apps.get_model('events', 'Participant')
+    participants = Participant.objects.using(schema_editor.connection.alias)
+    for bit, flag in enumerate(ITEM_FLAGS):
+        participants.filter(**{flag: True}).update(items_mask=F('items_mask').bitor(1 << bit))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0007_dataversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='participant',
+            name='items_mask',
+            field=models.PositiveSmallIntegerField(db_index=True, default=0),
+        ),
+        migrations.RunPython(backfill_items_mask, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_items_mask'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='participant',
+            name='items_mask',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='participant',
+            index=models.Index(fields=['items_mask', 'team'], name='participant_mask_team_idx'),
+        ),
+    ]
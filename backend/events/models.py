@@ -1,4 +1,11 @@
-from django.db import models
+from django.db import models, router, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .items import ITEM_BITS
+
+
+_UNKNOWN = object()
 
 
 class Team(models.Model):
@@ -12,7 +19,14 @@ class Team(models.Model):
         default='#00E676',
         help_text="Hex color code for team identification"
     )
+    member_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Denormalized number of participants in this team. "
+                  "Maintained by Participant.save() and a post_delete "
+                  "receiver; rebuild with `manage.py rebuild_member_counts`."
+    )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ['team_name']
@@ -22,6 +36,36 @@ class Team(models.Model):
     def __str__(self):
         return self.team_name
 
+    @classmethod
+    def adjust_member_count(cls, team_pk, delta, using=None):
+        """Atomically adds `delta` to a team's member_count in the database."""
+        if team_pk is None or not delta:
+            return
+        cls.objects.using(using).filter(pk=team_pk).update(
+            member_count=F('member_count') + delta,
+            updated_at=timezone.now(),
+        )
+
+    @classmethod
+    def rebuild_member_counts(cls, using=None):
+        """Recomputes member_count for every team from the Participant table."""
+        counts = dict(
+            Participant.objects.using(using)
+            .filter(team__isnull=False)
+            .values_list('team')
+            .annotate(n=models.Count('pk'))
+            .order_by()
+        )
+        updated = 0
+        with transaction.atomic(using=using):
+            for team in cls.objects.using(using).only('pk', 'member_count'):
+                actual = counts.get(team.pk, 0)
+                if team.member_count != actual:
+                    team.member_count = actual
+                    team.save(update_fields=['member_count', 'updated_at'])
+                    updated += 1
+        return updated
+
 
 class PreRegisteredMember(models.Model):
     """
@@ -42,6 +86,7 @@ class PreRegisteredMember(models.Model):
         help_text="True once an NFC UID has been assigned to this slot."
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ['name']
@@ -96,24 +141,142 @@ class Participant(models.Model):
     midnight_snacks = models.BooleanField(default=False)
     midnight_snacks_time = models.DateTimeField(null=True, blank=True)
 
+    # The six flags above packed into one integer (bit i = i-th item of
+    # ITEM_FIELDS). save() recomputes it; queryset.update() paths must OR in
+    # the item's bit themselves. Indexed together with team (see Meta).
+    items_mask = models.PositiveSmallIntegerField(default=0)
+
     created_at = models.DateTimeField(auto_now_add=True)
+    # Bumped by every write, including queryset.update() paths in the views;
+    # drives the /api/changes/ delta feed.
+    updated_at = models.DateTimeField(auto_now=True, db_index=True)
 
     class Meta:
         ordering = ['-created_at']
         verbose_name = "Participant"
         verbose_name_plural = "Participants"
+        indexes = [
+            # Serves items_mask filters, and covers the per-mask counts of
+            # all and of solo participants in one index-only GROUP BY.
+            models.Index(fields=['items_mask', 'team'], name='participant_mask_team_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.uid})"
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the persisted team so save() can move the member counters.
+        instance._loaded_team_id = instance.__dict__.get('team_id', _UNKNOWN)
+        return instance
+
+    def sync_items_mask(self):
+        """Recomputes items_mask from the item flags (for bulk_create callers)."""
+        self.items_mask = sum(bit for item, bit in ITEM_BITS.items() if getattr(self, item))
+        return self.items_mask
+
+    def save(self, *args, **kwargs):
+        """
+        Saves the participant and keeps Team.member_count in step, in the same
+        transaction, when the participant is created or moved between teams
+        (deletes are counted by a post_delete receiver in signals.py, which
+        QuerySet.delete() also sends). items_mask is recomputed from the
+        item flags, and a partial save (update_fields) still stamps updated_at
+        so the change reaches the /api/changes/ feed and the data version.
+        """
+        self.sync_items_mask()
+        update_fields = kwargs.get('update_fields')
+        if update_fields:
+            update_fields = {*update_fields, 'updated_at'}
+            if not ITEM_BITS.keys().isdisjoint(update_fields):
+                update_fields.add('items_mask')
+            kwargs['update_fields'] = update_fields
+        if update_fields is not None and 'team' not in update_fields and 'team_id' not in update_fields:
+            return super().save(*args, **kwargs)
+
+        using = kwargs.get('using') or router.db_for_write(Participant, instance=self)
+        with transaction.atomic(using=using):
+            if self._state.adding:
+                previous_team_id = None
+            else:
+                previous_team_id = getattr(self, '_loaded_team_id', _UNKNOWN)
+                if previous_team_id is _UNKNOWN:
+                    previous_team_id = (
+                        Participant.objects.using(using)
+                        .filter(pk=self.pk)
+                        .values_list('team_id', flat=True)
+                        .first()
+                    )
+            super().save(*args, **kwargs)
+            if previous_team_id != self.team_id:
+                self._move_member_count(previous_team_id, self.team_id, using)
+        self._loaded_team_id = self.team_id
+
+    def _move_member_count(self, old_team_id, new_team_id, using):
+        Team.adjust_member_count(old_team_id, -1, using=using)
+        Team.adjust_member_count(new_team_id, 1, using=using)
+        # Keep an already-loaded team instance consistent with the database.
+        if Participant.team.is_cached(self) and self.team is not None:
+            if self.team.pk == new_team_id:
+                self.team.member_count += 1
+            elif self.team.pk == old_team_id:
+                self.team.member_count -= 1
+
     @property
     def team_size(self):
         """Returns the number of members in this participant's team, or 1 if solo."""
         if self.team:
-            return self.team.members.count()
+            return self.team.member_count
         return 1
 
     @property
     def team_name_display(self):
         """Returns the team name or 'Individual' for solo participants."""
         return self.team.team_name if self.team else "Individual"
+
+
+class DataVersion(models.Model):
+    """
+    Single-row counter of deletes from event data. Inserts and updates move
+    the indexed updated_at columns instead, so reading the data version
+    (see events/dataversion.py) needs no write on the distribution path.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Data Version"
+        verbose_name_plural = "Data Version"
+
+    def __str__(self):
+        return f"v{self.version}"
+
+    @classmethod
+    def latest(cls, using=None):
+        """
+        Returns (deletes, newest updated_at of Participant, Team and
+        PreRegisteredMember) in one query: the counter row plus three
+        index lookups.
+        """
+        newest = [
+            models.Subquery(model.objects.order_by('-updated_at').values('updated_at')[:1])
+            for model in (Participant, Team, PreRegisteredMember)
+        ]
+        row = cls.objects.using(using).filter(pk=1).values_list('version', *newest).first()
+        if row is None:
+            # The counter row is created by migration 0007; only a flushed table lacks it.
+            row = (0, *(
+                model.objects.using(using).aggregate(newest=models.Max('updated_at'))['newest']
+                for model in (Participant, Team, PreRegisteredMember)
+            ))
+        deletes, *stamps = row
+        return deletes, max((stamp for stamp in stamps if stamp is not None), default=None)
+
+    @classmethod
+    def deletes(cls, using=None):
+        return cls.objects.using(using).filter(pk=1).values_list('version', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, using=None):
+        if not cls.objects.using(using).filter(pk=1).update(version=F('version') + 1):
+            cls.objects.using(using).get_or_create(pk=1, defaults={'version': 1})
@@ -0,0 +1,53 @@
+"""
+JSON rendering through orjson, with DRF's JSONRenderer output.
+
+orjson is optional: without it (or when a client asks for indented output)
+ORJSONRenderer falls back to DRF's json-based rendering. Types orjson does
+not handle natively (lazy strings, Decimal, ...) go through DRF's
+JSONEncoder.default.
+"""
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is not installed
+    orjson = None
+
+# OPT_UTC_Z writes UTC datetimes with a 'Z' suffix, like DRF's encoder.
+_ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+_default = JSONEncoder().default
+
+_json_encoder = JSONEncoder(ensure_ascii=False, separators=(',', ':'))
+
+
+def dumps(data):
+    """Encodes `data` as compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        ret = orjson.dumps(data, default=_default, option=_ORJSON_OPTIONS)
+    else:
+        ret = _json_encoder.encode(data).encode()
+    # Same as JSONRenderer: keep the output a strict JavaScript subset.
+    if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+        ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+    return ret
+
+
+class ORJSONRenderer(JSONRenderer):
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if orjson is None or indent is not None or not self.compact or self.ensure_ascii:
+            return super().render(data, accepted_media_type, renderer_context)
+        return dumps(data)
+
+
+class ColumnarRenderer(ORJSONRenderer):
+    """
+    Selected with ?format=columnar. Views that support it check
+    request.accepted_renderer.format and return column arrays.
+    """
+    format = 'columnar'
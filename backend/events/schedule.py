@@ -0,0 +1,154 @@
+"""
+Server-side distribution schedule.
+
+Windows come from settings.DISTRIBUTION_SCHEDULE (day offset, hour, minute
+from EVENT_START_DATE, mirroring mobile/lib/utils/time_manager.dart) and are
+compiled once into absolute datetimes plus a sorted boundary index, so
+"which items are open now" is a bisect over the boundaries and "is this item
+open" is a dict lookup. The compiled schedule is rebuilt when any of the
+settings it depends on change.
+"""
+
+import bisect
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+
+from .items import ITEM_FIELDS
+
+_SCHEDULE_SETTINGS = {
+    'DISTRIBUTION_SCHEDULE',
+    'DISTRIBUTION_GRACE_MINUTES',
+    'EVENT_START_DATE',
+    'ENFORCE_DISTRIBUTION_SCHEDULE',
+    'TIME_ZONE',
+}
+
+
+class Window:
+    """One item's distribution window. `closes_at` includes the grace period."""
+
+    __slots__ = ('item', 'label', 'start', 'end', 'closes_at')
+
+    def __init__(self, item, label, start, end, closes_at):
+        self.item = item
+        self.label = label
+        self.start = start
+        self.end = end
+        self.closes_at = closes_at
+
+    def contains(self, at):
+        return self.start <= at <= self.closes_at
+
+    def display(self):
+        start = timezone.localtime(self.start).strftime('%I:%M %p').lstrip('0')
+        end = timezone.localtime(self.end).strftime('%I:%M %p').lstrip('0')
+        return f'{start} - {end}'
+
+
+class Schedule:
+    """
+    Compiled distribution schedule.
+
+    The window edges split the timeline into elementary segments; `_active`
+    holds the items open throughout each segment, so overlapping windows
+    need no special handling at lookup time.
+    """
+
+    def __init__(self, event_start, windows, enforced):
+        self.event_start = event_start
+        self.enforced = enforced
+        self.windows = {w.item: w for w in sorted(windows, key=lambda w: (w.start, w.item))}
+
+        edges = sorted({w.start for w in windows} | {w.closes_at for w in windows})
+        self._boundaries = edges
+        self._active = []
+        for index, edge in enumerate(edges):
+            # Segment [edge, next_edge): windows are closed intervals, so an
+            # item closing exactly at `edge` is handled in active_items().
+            nxt = edges[index + 1] if index + 1 < len(edges) else None
+            self._active.append(tuple(
+                w.item for w in self.windows.values()
+                if w.start <= edge and (nxt is not None and nxt <= w.closes_at)
+            ))
+
+    def active_items(self, at=None):
+        """Item keys open at `at` (default now), in schedule order."""
+        at = at or timezone.now()
+        index = bisect.bisect_right(self._boundaries, at) - 1
+        if index < 0:
+            return ()
+        active = self._active[index]
+        if self._boundaries[index] == at:
+            # Windows whose grace period ends exactly now are still open.
+            closing = tuple(
+                w.item for w in self.windows.values()
+                if w.closes_at == at and w.item not in active
+            )
+            if closing:
+                return tuple(item for item in self.windows if item in active or item in closing)
+        return active
+
+    def is_open(self, item, at=None):
+        window = self.windows.get(item)
+        return window is None or window.contains(at or timezone.now())
+
+    def check(self, item, at=None):
+        """Returns the closed window for `item` if enforcement rejects `at`, else None."""
+        if not self.enforced or self.is_open(item, at):
+            return None
+        return self.windows[item]
+
+
+def _offset(event_start, value):
+    days, hours, minutes = value
+    return event_start + timedelta(days=days, hours=hours, minutes=minutes)
+
+
+def compile_schedule():
+    enforced = settings.ENFORCE_DISTRIBUTION_SCHEDULE
+    raw_date = settings.EVENT_START_DATE
+    if not raw_date:
+        if enforced:
+            raise ImproperlyConfigured(
+                'ENFORCE_DISTRIBUTION_SCHEDULE requires EVENT_START_DATE (YYYY-MM-DD).'
+            )
+        return Schedule(None, [], False)
+
+    start_date = parse_date(raw_date) if isinstance(raw_date, str) else raw_date
+    if start_date is None:
+        raise ImproperlyConfigured(f'EVENT_START_DATE "{raw_date}" is not a valid YYYY-MM-DD date.')
+    event_start = timezone.make_aware(datetime.combine(start_date, time.min))
+
+    windows = []
+    for item, spec in settings.DISTRIBUTION_SCHEDULE.items():
+        if item not in ITEM_FIELDS:
+            raise ImproperlyConfigured(f'DISTRIBUTION_SCHEDULE has unknown item "{item}".')
+        start, end = _offset(event_start, spec[0]), _offset(event_start, spec[1])
+        grace = spec[2] if len(spec) > 2 else settings.DISTRIBUTION_GRACE_MINUTES
+        if end <= start:
+            raise ImproperlyConfigured(f'DISTRIBUTION_SCHEDULE window for "{item}" ends before it starts.')
+        windows.append(Window(item, ITEM_FIELDS[item][2], start, end, end + timedelta(minutes=grace)))
+    return Schedule(event_start, windows, enforced)
+
+
+_schedule = None
+
+
+def get_schedule():
+    global _schedule
+    if _schedule is None:
+        _schedule = compile_schedule()
+    return _schedule
+
+
+@receiver(setting_changed)
+def _reset_schedule(setting, **kwargs):
+    global _schedule
+    if setting in _SCHEDULE_SETTINGS:
+        _schedule = None
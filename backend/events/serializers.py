@@ -1,19 +1,15 @@
 from rest_framework import serializers
-from .models import Team, Participant
+from .models import Team, Participant, PreRegisteredMember
 
 
 class TeamSerializer(serializers.ModelSerializer):
     """Serializer for Team info."""
-    member_count = serializers.SerializerMethodField()
 
     class Meta:
         model = Team
         fields = ['team_id', 'team_name', 'team_color', 'member_count', 'created_at']
         read_only_fields = fields
 
-    def get_member_count(self, obj):
-        return obj.members.count()
-
 
 class TeamMemberSerializer(serializers.ModelSerializer):
     """Compact serializer for team member listings."""
@@ -31,11 +27,7 @@ class TeamMemberSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_items_collected(self, obj):
-        count = 0
-        for field in ['registration_goodies', 'breakfast', 'lunch', 'snacks', 'dinner', 'midnight_snacks']:
-            if getattr(obj, field):
-                count += 1
-        return count
+        return bin(obj.items_mask).count('1')
 
     def get_last_scan(self, obj):
         timestamps = [
@@ -76,6 +68,22 @@ class ScanRequestSerializer(serializers.Serializer):
         return value.upper().replace(':', '').replace('-', '').strip()
 
 
+class ScanCollectRequestSerializer(serializers.Serializer):
+    """Validates a combined scan-and-collect request."""
+    uid = serializers.CharField(max_length=32)
+    item = serializers.ChoiceField(choices=[
+        ('registration_goodies', 'Registration & Goodies'),
+        ('breakfast', 'Breakfast'),
+        ('lunch', 'Lunch'),
+        ('snacks', 'Snacks'),
+        ('dinner', 'Dinner'),
+        ('midnight_snacks', 'Midnight Snacks'),
+    ])
+
+    def validate_uid(self, value):
+        return value.upper().replace(':', '').replace('-', '').strip()
+
+
 class DistributeRequestSerializer(serializers.Serializer):
     """Validates the UID sent for a distribution action."""
     uid = serializers.CharField(max_length=32)
@@ -84,6 +92,21 @@ class DistributeRequestSerializer(serializers.Serializer):
         return value.upper().replace(':', '').replace('-', '').strip()
 
 
+class DistributeBatchEntrySerializer(serializers.Serializer):
+    """One queued tap in a batch distribution request."""
+    uid = serializers.CharField(max_length=32)
+    item = serializers.CharField(max_length=50)
+    client_ts = serializers.DateTimeField(required=False, allow_null=True)
+
+    def validate_uid(self, value):
+        return value.upper().replace(':', '').replace('-', '').strip()
+
+
+class DistributeBatchRequestSerializer(serializers.Serializer):
+    """Validates a batch of queued distribution taps."""
+    entries = DistributeBatchEntrySerializer(many=True, allow_empty=False, max_length=500)
+
+
 class TeamDistributeRequestSerializer(serializers.Serializer):
     """Validates a bulk team distribution request."""
     team_id = serializers.CharField(max_length=50)
@@ -97,6 +120,24 @@ class TeamDistributeRequestSerializer(serializers.Serializer):
     ])
 
 
+class TeamsStatsQuerySerializer(serializers.Serializer):
+    """Validates the leaderboard paging query params of /api/teams/stats/."""
+    limit = serializers.IntegerField(min_value=1, max_value=100, default=10)
+    offset = serializers.IntegerField(min_value=0, default=0)
+
+
+class AttendeesPageQuerySerializer(serializers.Serializer):
+    """Validates the paging/streaming query params of /api/attendees/."""
+    page_size = serializers.IntegerField(min_value=1, max_value=500, required=False)
+    cursor = serializers.CharField(required=False, allow_blank=True)
+    stream = serializers.BooleanField(default=False)
+
+
+class ChangesQuerySerializer(serializers.Serializer):
+    """Validates the query params of /api/changes/."""
+    since = serializers.CharField(required=False, allow_blank=True)
+
+
 class LoginRequestSerializer(serializers.Serializer):
     """Validates admin login credentials."""
     username = serializers.CharField(max_length=150)
@@ -112,6 +153,16 @@ class PreRegMemberSerializer(serializers.Serializer):
     college = serializers.CharField()
 
 
+class PreRegisteredMemberSerializer(serializers.ModelSerializer):
+    """Pre-registered member slot as sent by the changes feed."""
+    team_id = serializers.CharField(source='team.team_id')
+
+    class Meta:
+        model = PreRegisteredMember
+        fields = ['id', 'team_id', 'name', 'college', 'is_linked']
+        read_only_fields = fields
+
+
 class PreRegTeamSerializer(serializers.Serializer):
     """Team with its list of unlinked pre-registered member slots."""
     team_id = serializers.CharField()
@@ -0,0 +1,74 @@
+"""
+Model signal handlers that keep the in-process caches, the data version and
+Team.member_count consistent with writes made outside the API views (admin
+edits, shell, management commands, queryset deletes).
+"""
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .cache import scan_cache, token_cache
+from .models import DataVersion, Participant, PreRegisteredMember, Team
+
+
+def _invalidate_now_and_on_commit(using, invalidate):
+    # Signals fire before the surrounding transaction commits; a scan in
+    # between still reads the old row, so invalidate again once it is visible.
+    invalidate()
+    transaction.on_commit(invalidate, using=using)
+
+
+@receiver(post_delete, sender=Participant)
+def decrement_member_count(sender, instance, using, **kwargs):
+    # Here rather than in Participant.delete(), which QuerySet.delete() skips.
+    # Runs inside the deletion's transaction.
+    instance._move_member_count(instance.team_id, None, using)
+
+
+@receiver(post_save, sender=Participant)
+@receiver(post_delete, sender=Participant)
+def invalidate_participant_scan(sender, instance, using, **kwargs):
+    uid, team_ids = instance.uid, {instance.team_id}
+    # A move between teams also changes team_size for the old teammates.
+    previous_team_id = getattr(instance, '_loaded_team_id', None)
+    if isinstance(previous_team_id, int):
+        team_ids.add(previous_team_id)
+
+    def invalidate():
+        scan_cache.invalidate(uid)
+        for team_id in team_ids:
+            scan_cache.invalidate_team(team_id)
+
+    _invalidate_now_and_on_commit(using, invalidate)
+
+
+@receiver(post_save, sender=Team)
+@receiver(post_delete, sender=Team)
+def invalidate_team_scans(sender, instance, using, **kwargs):
+    team_pk = instance.pk
+    _invalidate_now_and_on_commit(using, lambda: scan_cache.invalidate_team(team_pk))
+
+
+@receiver(post_delete, sender=Participant)
+@receiver(post_delete, sender=Team)
+@receiver(post_delete, sender=PreRegisteredMember)
+def bump_version_on_delete(sender, using, **kwargs):
+    # Inserts and updates move updated_at; a delete leaves no stamp behind.
+    # Runs inside the deletion's transaction.
+    DataVersion.bump(using)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    token_cache.invalidate(instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_tokens(sender, instance, update_fields=None, **kwargs):
+    # Logins only touch last_login, which authentication does not depend on.
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    token_cache.invalidate(*Token.objects.filter(user_id=instance.pk).values_list('key', flat=True))
@@ -0,0 +1,148 @@
+"""
+Scaling tests for the API.
+
+Every endpoint is called against a small event and again after it has grown
+to N teams x M members. The query count must be identical at both sizes
+(no per-row or per-team queries). With PERF_BUDGETS=1, each request at the
+larger size must also finish inside its wall-time budget.
+"""
+
+import os
+import time
+
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+from .cache import scan_cache
+from .models import Team, Participant, PreRegisteredMember
+
+# (teams, members per team)
+SMALL = (3, 4)
+LARGE = (40, 25)
+
+# Seconds per request at the LARGE size; a query per row or a quadratic loop
+# goes well past them. Only asserted with PERF_BUDGETS=1: on a loaded or
+# single-CPU runner wall time fails for reasons unrelated to the code, so
+# the query counts are the hard check.
+ENFORCE_BUDGETS = os.environ.get('PERF_BUDGETS', '').lower() in ('1', 'true', 'yes')
+DEFAULT_BUDGET = 0.5
+BUDGETS = {
+    'attendees': 1.5,
+    'attendees-team-view': 1.5,
+    'changes': 2.0,
+    'export-csv': 1.5,
+}
+
+# name, method, path, body. '{p}' is replaced by the seed prefix, so each
+# size is queried through its own rows: '{p}_0' is a team of M members,
+# '{p}000M001' one of its members that has not had lunch yet.
+ENDPOINTS = [
+    ('scan', 'post', '/api/scan/', {'uid': '{p}000M000'}),
+    ('scan-collect', 'post', '/api/scan-collect/', {'uid': '{p}000M002', 'item': 'dinner'}),
+    ('give-lunch', 'post', '/api/give-lunch/', {'uid': '{p}000M001'}),
+    ('distribute-batch', 'post', '/api/distribute-batch/', {'entries': [
+        {'uid': '{p}001M000', 'item': 'snacks'},
+        {'uid': '{p}001M001', 'item': 'snacks'},
+    ]}),
+    ('distribute-team', 'post', '/api/distribute-team/', {'team_id': '{p}_0', 'item': 'breakfast'}),
+    ('team-details', 'get', '/api/team/{p}_0/', None),
+    ('stats', 'get', '/api/stats/', None),
+    ('teams-stats', 'get', '/api/teams/stats/', None),
+    ('attendees', 'get', '/api/attendees/', None),
+    ('attendees-team-view', 'get', '/api/attendees/?view=team', None),
+    ('attendees-page', 'get', '/api/attendees/?page_size=50', None),
+    ('changes', 'get', '/api/changes/', None),
+    ('export-csv', 'get', '/api/export/attendees.csv', None),
+    ('prereg-teams', 'get', '/api/prereg/teams/', None),
+    ('schedule', 'get', '/api/schedule/', None),
+]
+
+
+def _fill(value, prefix):
+    if isinstance(value, str):
+        return value.replace('{p}', prefix)
+    if isinstance(value, dict):
+        return {key: _fill(v, prefix) for key, v in value.items()}
+    if isinstance(value, list):
+        return [_fill(v, prefix) for v in value]
+    return value
+
+
+def seed_event(prefix, teams, members):
+    """Bulk-creates `teams` teams of `members` participants plus pre-registered slots."""
+    team_objs = Team.objects.bulk_create([
+        Team(team_id=f'{prefix}_{t}', team_name=f'{prefix} Team {t:03}') for t in range(teams)
+    ])
+    participants = [
+        Participant(
+            uid=f'{prefix}{t:03}M{m:03}', name=f'Member {m}', college='MRU', team=team,
+            registration_goodies=True, lunch=(m % 2 == 0),
+        )
+        for t, team in enumerate(team_objs) for m in range(members)
+    ] + [Participant(uid=f'{prefix}SOLO', name='Solo', college='IIT')]
+    for participant in participants:
+        participant.sync_items_mask()
+    Participant.objects.bulk_create(participants)
+    PreRegisteredMember.objects.bulk_create([
+        PreRegisteredMember(team=team, name=f'Slot {m}', college='MRU', is_linked=(m % 2 == 0))
+        for team in team_objs for m in range(members)
+    ])
+    Team.rebuild_member_counts()
+
+
+class EndpointScalingTest(TestCase):
+    """Query counts per endpoint must not depend on the number of teams or members."""
+
+    def setUp(self):
+        self.client = APIClient()
+        self.user = User.objects.create_user(username='testadmin', password='testpass')
+        self.client.force_authenticate(user=self.user)
+
+    def _call(self, method, path, body, prefix):
+        # A warm scan cache would hide the scan queries.
+        scan_cache.clear()
+        path = _fill(path, prefix)
+        if body is None:
+            response = getattr(self.client, method)(path)
+        else:
+            response = getattr(self.client, method)(path, _fill(body, prefix), format='json')
+        if response.streaming:
+            b''.join(response.streaming_content)
+        self.assertLess(response.status_code, 400, f'{method.upper()} {path}: {response.status_code}')
+        return response
+
+    def test_query_counts_and_budgets(self):
+        seed_event('S', *SMALL)
+        expected = {}
+        for name, method, path, body in ENDPOINTS:
+            with CaptureQueriesContext(connection) as ctx:
+                self._call(method, path, body, 'S')
+            expected[name] = len(ctx.captured_queries)
+
+        seed_event('L', *LARGE)
+        for name, method, path, body in ENDPOINTS:
+            with self.subTest(endpoint=name):
+                start = time.perf_counter()
+                with self.assertNumQueries(expected[name]):
+                    self._call(method, path, body, 'L')
+                elapsed = time.perf_counter() - start
+                budget = BUDGETS.get(name, DEFAULT_BUDGET)
+                if ENFORCE_BUDGETS:
+                    self.assertLess(elapsed, budget, f'{name} took {elapsed:.3f}s (budget {budget}s)')
+
+    def test_large_event_results(self):
+        # The endpoints above are only comparable if they really see the large event.
+        seed_event('L', *LARGE)
+        teams, members = LARGE
+        response = self.client.get('/api/team/L_0/')
+        self.assertEqual(response.data['member_count'], members)
+        self.assertEqual(response.data['team_progress']['lunch'], f'{(members + 1) // 2}/{members}')
+        self.assertEqual(response.data['team_progress']['registration_goodies'], f'{members}/{members}')
+        response = self.client.get('/api/prereg/teams/')
+        self.assertEqual(len(response.data), teams)
+        self.assertEqual(len(response.data[0]['unregistered_members']), members // 2)
+        response = self.client.get('/api/stats/')
+        self.assertEqual(response.data['total_participants'], teams * members + 1)
@@ -4,18 +4,26 @@ from . import views
 urlpatterns = [
     path('login/', views.admin_login, name='api-login'),
     path('scan/', views.scan_uid, name='api-scan'),
+    path('scan-collect/', views.scan_collect, name='api-scan-collect'),
     path('give-registration/', views.give_registration, name='api-give-registration'),
     path('give-breakfast/', views.give_breakfast, name='api-give-breakfast'),
     path('give-lunch/', views.give_lunch, name='api-give-lunch'),
     path('give-snacks/', views.give_snacks, name='api-give-snacks'),
     path('give-dinner/', views.give_dinner, name='api-give-dinner'),
     path('give-midnight-snacks/', views.give_midnight_snacks, name='api-give-midnight-snacks'),
+    path('distribute-batch/', views.distribute_batch, name='api-distribute-batch'),
+    path('schedule/', views.distribution_schedule, name='api-schedule'),
     path('stats/', views.dashboard_stats, name='api-stats'),
+    path('stats/live/', views.dashboard_stats_live, name='api-stats-live'),
+    path('metrics/', views.metrics, name='api-metrics'),
     # Team endpoints
     path('team/<str:team_id>/', views.team_details, name='api-team-details'),
     path('distribute-team/', views.distribute_team, name='api-distribute-team'),
     path('teams/stats/', views.teams_stats, name='api-teams-stats'),
     path('attendees/', views.attendees_list, name='api-attendees'),
+    path('changes/', views.changes_feed, name='api-changes'),
+    path('export/attendees.csv', views.export_attendees_csv, name='api-export-attendees-csv'),
+    path('export/attendees.xlsx', views.export_attendees_xlsx, name='api-export-attendees-xlsx'),
     # Pre-registration endpoints
     path('prereg/teams/', views.prereg_teams_list, name='api-prereg-teams'),
     path('prereg/register/', views.register_nfc_tag, name='api-prereg-register'),
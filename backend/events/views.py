@@ -1,20 +1,61 @@
+import json
+import time
+from collections import Counter
+from datetime import timedelta
+from itertools import groupby
+from operator import attrgetter
+
 from django.db import transaction
-from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
+from django.views.decorators.gzip import gzip_page
+from django.db.models import Count, F, FloatField, Prefetch, Q, Sum, Value
+from django.db.models.functions import Cast
+from django.conf import settings
 from django.utils import timezone
 from django.contrib.auth import authenticate
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, permission_classes, renderer_classes
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.renderers import BrowsableAPIRenderer
 from rest_framework.response import Response
 from rest_framework.authtoken.models import Token
 
-from .models import Team, Participant, PreRegisteredMember
+from .cache import scan_cache, token_cache
+from .dataversion import current_data_version, etag_on_data_version
+from .db import read_from_replica
+from .encoders import (
+    encode_participant,
+    encode_participant_columns,
+    encode_participants,
+    encode_team_member_columns,
+    encode_team_members,
+)
+from .live import EventStreamRenderer, publish_stats_delta, publishes_stats, stats_broker
+from .metrics import record_distribution, render_prometheus
+from .items import ITEM_BITS, ITEM_FIELDS, STAT_KEYS, masks_missing_any, masks_with_all
+from .models import DataVersion, Team, Participant, PreRegisteredMember
+from .exports import export_rows, stream_csv, stream_xlsx
+from .pagination import (
+    KEYSET_ORDERING,
+    decode_since_cursor,
+    encode_since_cursor,
+    keyset_page,
+    stream_json_list,
+)
+from .renderers import ColumnarRenderer, ORJSONRenderer
+from .schedule import get_schedule
 from .serializers import (
-    ParticipantSerializer,
-    TeamMemberSerializer,
+    TeamSerializer,
+    PreRegisteredMemberSerializer,
+    AttendeesPageQuerySerializer,
+    ChangesQuerySerializer,
     ScanRequestSerializer,
+    ScanCollectRequestSerializer,
     DistributeRequestSerializer,
+    DistributeBatchRequestSerializer,
     TeamDistributeRequestSerializer,
+    TeamsStatsQuerySerializer,
     LoginRequestSerializer,
     PreRegMemberSerializer,
     PreRegTeamSerializer,
@@ -23,15 +64,11 @@ from .serializers import (
     AddMemberSerializer,
 )
 
-# ---------- Item field mapping ----------
-ITEM_FIELDS = {
-    'registration_goodies': ('registration_goodies', 'registration_time', 'Registration & Goodies'),
-    'breakfast':            ('breakfast',            'breakfast_time',     'Breakfast'),
-    'lunch':                ('lunch',                'lunch_time',         'Lunch'),
-    'snacks':               ('snacks',               'snacks_time',        'Snacks'),
-    'dinner':               ('dinner',               'dinner_time',        'Dinner'),
-    'midnight_snacks':      ('midnight_snacks',      'midnight_snacks_time', 'Midnight Snacks'),
-}
+# Page size of /api/attendees/ when only a cursor is given.
+DEFAULT_PAGE_SIZE = 100
+
+# List endpoints that also answer ?format=columnar.
+LIST_RENDERERS = [ORJSONRenderer, ColumnarRenderer, BrowsableAPIRenderer]
 
 
 @api_view(['POST'])
@@ -41,11 +78,19 @@ def scan_uid(request):
     POST /api/scan/
     Lookup a participant by NFC tag UID.
     Returns participant info, distribution status, and team info.
+    Payloads are served from the in-process scan cache when warm.
     """
     serializer = ScanRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     uid = serializer.validated_data['uid']
 
+    payload = scan_cache.lookup(uid)
+    if payload is not None:
+        return Response(payload)
+
+    # Taken before the read: put() skips the payload if a write invalidated
+    # this UID (or its team) while it was being built.
+    generation = scan_cache.generation()
     try:
         participant = Participant.objects.select_related('team').get(uid=uid)
     except Participant.DoesNotExist:
@@ -56,7 +101,14 @@ def scan_uid(request):
             'message': 'This NFC tag is not linked to any participant yet.',
         }, status=status.HTTP_404_NOT_FOUND)
 
-    return Response({
+    payload = _scan_payload(participant)
+    scan_cache.put(uid, payload, team_pk=participant.team_id, generation=generation)
+    return Response(payload)
+
+
+def _scan_payload(participant):
+    """Builds the /api/scan/ response body for a participant (team preloaded)."""
+    return {
         'status': 'valid',
         'uid': participant.uid,
         'name': participant.name,
@@ -77,52 +129,221 @@ def scan_uid(request):
         'dinner_time': participant.dinner_time,
         'midnight_snacks': participant.midnight_snacks,
         'midnight_snacks_time': participant.midnight_snacks_time,
-    })
+    }
 
 
+def _mark_collected(uid, field_name, time_field_name, collected_at=None):
+    """
+    Compare-and-set: a single conditional UPDATE (WHERE uid=? AND field=FALSE)
+    flips the flag without holding a row lock across round-trips.
+    Returns True if this call collected the item, False if it was already
+    collected (or the UID is unknown).
+    """
+    return bool(Participant.objects.filter(uid=uid, **{field_name: False}).update(
+        **{field_name: True, time_field_name: collected_at or timezone.now()},
+        items_mask=F('items_mask').bitor(ITEM_BITS[field_name]),
+        updated_at=timezone.now(),
+    ))
+
+
+def _collect_item(uid, field_name, time_field_name, collected_at=None):
+    """
+    Marks one item as collected for the participant with `uid`.
+    The affected row count of the compare-and-set UPDATE decides the outcome,
+    so concurrent taps are safe on every backend.
+    Returns (status, participant): status is 'success', 'already_collected' or
+    'invalid' (participant is None when the UID is unknown). The participant
+    only has uid, name and college loaded.
+    """
+    updated = _mark_collected(uid, field_name, time_field_name, collected_at)
+    participant = Participant.objects.only('uid', 'name', 'college').filter(uid=uid).first()
+    if participant is None:
+        return 'invalid', None
+    return ('success' if updated else 'already_collected'), participant
+
+
+def _outside_window(item, at=None):
+    """
+    Returns a 403 response when the distribution schedule is enforced and
+    `item` is not open at `at` (default now), else None.
+    """
+    window = get_schedule().check(item, at)
+    if window is None:
+        return None
+    return Response({
+        'status': 'outside_window',
+        'item': item,
+        'message': f'{window.label} is not being distributed now ({window.display()}).',
+    }, status=status.HTTP_403_FORBIDDEN)
+
+
+@publishes_stats
 def _distribute(request, field_name, time_field_name, label):
     """
     Generic distribution handler.
-    Uses transaction.atomic + select_for_update to prevent race conditions.
+    Uses an atomic compare-and-set UPDATE to prevent race conditions.
     Returns success or already_collected.
     """
     serializer = DistributeRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
     uid = serializer.validated_data['uid']
 
-    try:
-        with transaction.atomic():
-            participant = (
-                Participant.objects
-                .select_for_update()
-                .get(uid=uid)
-            )
-
-            if getattr(participant, field_name):
-                return Response({
-                    'status': 'already_collected',
-                    'message': f'{label} already collected by {participant.name}.',
-                    'name': participant.name,
-                    'college': participant.college,
-                })
-
-            setattr(participant, field_name, True)
-            setattr(participant, time_field_name, timezone.now())
-            participant.save(update_fields=[field_name, time_field_name])
+    closed = _outside_window(field_name)
+    if closed:
+        return closed
 
-            return Response({
-                'status': 'success',
-                'message': f'{label} given to {participant.name}.',
-                'name': participant.name,
-                'college': participant.college,
-            })
+    result, participant = _collect_item(uid, field_name, time_field_name)
 
-    except Participant.DoesNotExist:
+    if result == 'invalid':
         return Response({
             'status': 'invalid',
             'message': 'No participant found with this NFC tag.',
         }, status=status.HTTP_404_NOT_FOUND)
 
+    record_distribution(field_name, result)
+    if result == 'already_collected':
+        return Response({
+            'status': 'already_collected',
+            'message': f'{label} already collected by {participant.name}.',
+            'name': participant.name,
+            'college': participant.college,
+        })
+
+    # The UPDATE has committed (autocommit); a scan that read the old row
+    # before this point fails its generation check in put().
+    scan_cache.invalidate(uid)
+    publish_stats_delta({STAT_KEYS[field_name]: 1})
+
+    return Response({
+        'status': 'success',
+        'message': f'{label} given to {participant.name}.',
+        'name': participant.name,
+        'college': participant.college,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@publishes_stats
+def scan_collect(request):
+    """
+    POST /api/scan-collect/
+    Scan and collect in one round-trip: atomically marks `item` as collected
+    and returns the full scan payload (same shape as /api/scan/) with the
+    distribution result as `status` ('success' or 'already_collected').
+    Body: { "uid": "...", "item": "lunch" }
+    """
+    serializer = ScanCollectRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+    uid = serializer.validated_data['uid']
+    item = serializer.validated_data['item']
+    field_name, time_field_name, label = ITEM_FIELDS[item]
+
+    closed = _outside_window(item)
+    if closed:
+        return closed
+
+    updated = _mark_collected(uid, field_name, time_field_name)
+    if updated:
+        scan_cache.invalidate(uid)
+    generation = scan_cache.generation()
+    participant = Participant.objects.select_related('team').filter(uid=uid).first()
+    if participant is None:
+        return Response({
+            'status': 'unregistered',
+            'uid': uid,
+            'message': 'This NFC tag is not linked to any participant yet.',
+        }, status=status.HTTP_404_NOT_FOUND)
+
+    payload = _scan_payload(participant)
+    record_distribution(item, 'success' if updated else 'already_collected')
+    if updated:
+        publish_stats_delta({STAT_KEYS[item]: 1})
+    scan_cache.put(uid, payload, team_pk=participant.team_id, generation=generation)
+
+    if updated:
+        message = f'{label} given to {participant.name}.'
+    else:
+        message = f'{label} already collected by {participant.name}.'
+    return Response({
+        **payload,
+        'status': 'success' if updated else 'already_collected',
+        'item': item,
+        'message': message,
+    })
+
+
+@api_view(['POST'])
+@permission_classes([IsAuthenticated])
+@publishes_stats
+def distribute_batch(request):
+    """
+    POST /api/distribute-batch/
+    Applies a queue of offline taps in one transaction.
+    Body: { "entries": [ { "uid": "...", "item": "lunch", "client_ts": "..." }, ... ] }
+    Each entry gets its own result: success, already_collected or invalid.
+    client_ts (optional) is recorded as the collection time, capped at the server's now,
+    and is the time checked against the distribution schedule when it is enforced.
+    """
+    serializer = DistributeBatchRequestSerializer(data=request.data)
+    serializer.is_valid(raise_exception=True)
+
+    now = timezone.now()
+    results = []
+    collected_uids = []
+    delta = Counter()
+    with transaction.atomic():
+        for entry in serializer.validated_data['entries']:
+            uid = entry['uid']
+            item = entry['item']
+            result = {'uid': uid, 'item': item}
+            if item not in ITEM_FIELDS:
+                result.update(status='invalid', message=f'Unknown item "{item}".')
+                results.append(result)
+                continue
+
+            field_name, time_field_name, label = ITEM_FIELDS[item]
+            client_ts = entry.get('client_ts')
+            collected_at = min(client_ts, now) if client_ts else now
+            window = get_schedule().check(item, collected_at)
+            if window is not None:
+                result.update(
+                    status='invalid',
+                    message=f'{label} was not being distributed at that time ({window.display()}).',
+                )
+                results.append(result)
+                continue
+
+            outcome, participant = _collect_item(uid, field_name, time_field_name, collected_at)
+
+            result['status'] = outcome
+            if participant is None:
+                result['message'] = 'No participant found with this NFC tag.'
+            else:
+                record_distribution(item, outcome)
+                result['name'] = participant.name
+                if outcome == 'success':
+                    result['message'] = f'{label} given to {participant.name}.'
+                    collected_uids.append(uid)
+                    delta[STAT_KEYS[item]] += 1
+                else:
+                    result['message'] = f'{label} already collected by {participant.name}.'
+            results.append(result)
+
+    scan_cache.invalidate(*collected_uids)
+    if collected_uids:
+        publish_stats_delta(delta)
+
+    summary = {'success': 0, 'already_collected': 0, 'invalid': 0}
+    for result in results:
+        summary[result['status']] += 1
+
+    return Response({
+        'status': 'success',
+        'results': results,
+        'summary': summary,
+    })
+
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
@@ -166,6 +387,44 @@ def give_midnight_snacks(request):
     return _distribute(request, 'midnight_snacks', 'midnight_snacks_time', 'Midnight Snacks')
 
 
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def distribution_schedule(request):
+    """
+    GET /api/schedule/
+    Returns the distribution windows and the items open right now, so
+    stations can auto-select the current item. Until EVENT_START_DATE is
+    configured, `items` and `active` are empty and `event_start` is null.
+    """
+    schedule = get_schedule()
+    now = timezone.now()
+    items = []
+    for window in schedule.windows.values():
+        if now < window.start:
+            state = 'locked'
+        elif now > window.closes_at:
+            state = 'expired'
+        else:
+            state = 'available'
+        items.append({
+            'item': window.item,
+            'label': window.label,
+            'start': window.start,
+            'end': window.end,
+            'closes_at': window.closes_at,
+            'state': state,
+        })
+
+    return Response({
+        'status': 'success',
+        'enforced': schedule.enforced,
+        'event_start': schedule.event_start.date() if schedule.event_start else None,
+        'server_time': now,
+        'active': list(schedule.active_items(now)),
+        'items': items,
+    })
+
+
 @api_view(['POST'])
 @permission_classes([AllowAny])
 def admin_login(request):
@@ -199,41 +458,155 @@ def admin_login(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_from_replica
+@etag_on_data_version
 def dashboard_stats(request):
     """
     GET /api/stats/
     Returns distribution statistics for the admin dashboard.
-    Includes team-related stats.
+    Includes team-related stats. Participant counters come from an items_mask
+    histogram and a solo count; the team total is a separate index-only count.
     """
-    total = Participant.objects.count()
-    total_teams = Team.objects.count()
-    solo_count = Participant.objects.filter(team__isnull=True).count()
-    team_members_count = total - solo_count
+    return Response(_dashboard_stats())
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+@renderer_classes([ORJSONRenderer, EventStreamRenderer])
+def dashboard_stats_live(request):
+    """
+    GET /api/stats/live/
+    Server-sent events feed for the dashboard. Sends a `snapshot` event (same
+    body as /api/stats/), then `delta` events with counter increments, e.g.
+    {"lunch_given": 3}, as distributions and registrations commit. Clients
+    add deltas to the snapshot and recompute average_team_size. Changes made
+    by other worker processes arrive as deltas too, within a heartbeat. The
+    stream closes after LIVE_STATS_MAX_SECONDS; EventSource
+    clients reconnect on their own.
+    """
+    response = StreamingHttpResponse(_live_stats_events(), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+def _dashboard_stats():
+    return _with_average(_dashboard_counters())
 
+
+def _dashboard_counters():
+    counters = _participant_counters()
     stats = {
-        'total_participants': total,
-        'total_teams': total_teams,
-        'solo_participants': solo_count,
-        'average_team_size': round(team_members_count / total_teams, 1) if total_teams > 0 else 0,
-        'registration_given': Participant.objects.filter(registration_goodies=True).count(),
-        'breakfast_given': Participant.objects.filter(breakfast=True).count(),
-        'lunch_given': Participant.objects.filter(lunch=True).count(),
-        'snacks_given': Participant.objects.filter(snacks=True).count(),
-        'dinner_given': Participant.objects.filter(dinner=True).count(),
-        'midnight_snacks_given': Participant.objects.filter(midnight_snacks=True).count(),
+        'total_participants': counters['total_participants'],
+        'total_teams': Team.objects.count(),
+        'solo_participants': counters['solo_participants'],
     }
-    return Response(stats)
+    for item_key in ITEM_FIELDS:
+        stats[STAT_KEYS[item_key]] = counters[item_key]
+    return stats
+
+
+def _with_average(counters):
+    team_members_count = counters['total_participants'] - counters['solo_participants']
+    total_teams = counters['total_teams']
+    stats = dict(counters)
+    stats['average_team_size'] = round(team_members_count / total_teams, 1) if total_teams > 0 else 0
+    return stats
+
+
+def _sse(event, seq, data):
+    return f'event: {event}\nid: {seq}\ndata: {json.dumps(data)}\n\n'
+
+
+def _live_stats_state():
+    """
+    (seq, counters) of this process's broker. Checks for writes from other
+    processes at most once per heartbeat, whatever the number of streams.
+    """
+    return stats_broker.refresh(current_data_version, _dashboard_counters, settings.LIVE_STATS_HEARTBEAT)
+
+
+def _live_stats_events():
+    heartbeat = settings.LIVE_STATS_HEARTBEAT
+    deadline = time.monotonic() + settings.LIVE_STATS_MAX_SECONDS
+    yield 'retry: 3000\n\n'
+    while time.monotonic() < deadline:
+        # The counters include every delta up to seq and none after it.
+        seq, counters = _live_stats_state()
+        yield _sse('snapshot', seq, _with_average(counters))
+
+        next_check = time.monotonic() + heartbeat
+        while True:
+            now = time.monotonic()
+            if now >= deadline:
+                return
+            events = stats_broker.wait(seq, timeout=min(next_check, deadline) - now)
+            if events is None:
+                break  # Missed deltas: resend a snapshot.
+            for seq, delta in events:
+                yield _sse('delta', seq, delta)
+            if time.monotonic() >= next_check:
+                # Deltas only cover this process's writes. Changes made by
+                # others arrive as a delta published by the check.
+                _live_stats_state()
+                if not events:
+                    yield ': keep-alive\n\n'
+                next_check = time.monotonic() + heartbeat
+
+
+def _participant_counters():
+    """
+    Computes the participant totals, solo count and per-item collected
+    counts in one query: a histogram of items_mask (at most 64 rows, read
+    from the (items_mask, team) index alone) with a solo count per mask.
+    """
+    histogram = (
+        Participant.objects.values_list('items_mask')
+        .annotate(n=Count('pk'), solo=Count('pk', filter=Q(team__isnull=True)))
+        .order_by()
+    )
+    counters = dict.fromkeys(ITEM_FIELDS, 0)
+    counters['total_participants'] = counters['solo_participants'] = 0
+    for mask, n, solo in histogram:
+        counters['total_participants'] += n
+        counters['solo_participants'] += solo
+        for item_key, bit in ITEM_BITS.items():
+            if mask & bit:
+                counters[item_key] += n
+    return counters
+
+
+# ---------- Metrics ----------
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def metrics(request):
+    """
+    GET /api/metrics/
+    Per-process request, SQL, distribution and cache counters in the
+    Prometheus text exposition format. Scrape every worker process.
+    """
+    return HttpResponse(
+        render_prometheus({'scan': scan_cache, 'token': token_cache}),
+        content_type='text/plain; version=0.0.4; charset=utf-8',
+    )
 
 
 # ---------- NEW TEAM ENDPOINTS ----------
 
 
+@gzip_page
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes(LIST_RENDERERS)
+@read_from_replica
+@etag_on_data_version
 def team_details(request, team_id):
     """
     GET /api/team/<team_id>/
     Returns detailed team info: members list and per-item collection progress.
+    ?format=columnar returns the members as column arrays.
     """
     try:
         team = Team.objects.get(team_id=team_id)
@@ -243,32 +616,37 @@ def team_details(request, team_id):
             'message': 'Team not found.',
         }, status=status.HTTP_404_NOT_FOUND)
 
-    members = team.members.all()
-    member_count = members.count()
+    # One query for the members; counts and progress are taken from those rows.
+    members = list(team.members.all())
+    member_count = len(members)
 
-    # Calculate per-item team progress
     team_progress = {}
     for item_key, (field, _, label) in ITEM_FIELDS.items():
-        collected = members.filter(**{field: True}).count()
+        collected = sum(1 for member in members if getattr(member, field))
         team_progress[item_key] = f"{collected}/{member_count}"
 
-    return Response({
+    data = {
         'team_id': team.team_id,
         'team_name': team.team_name,
         'team_color': team.team_color,
         'member_count': member_count,
-        'members': TeamMemberSerializer(members, many=True).data,
+        'members': encode_team_members(members),
         'team_progress': team_progress,
-    })
+    }
+    if _columnar(request):
+        data.update(item_bits=list(ITEM_BITS), members=encode_team_member_columns(members))
+    return Response(data)
 
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@publishes_stats
 def distribute_team(request):
     """
     POST /api/distribute-team/
     Bulk distribute a single item to all uncollected team members.
     Body: { "team_id": "...", "item": "lunch" }
+    Runs a constant number of statements regardless of team size.
     """
     serializer = TeamDistributeRequestSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)
@@ -278,6 +656,10 @@ def distribute_team(request):
 
     field_name, time_field_name, label = ITEM_FIELDS[item]
 
+    closed = _outside_window(item)
+    if closed:
+        return closed
+
     try:
         team = Team.objects.get(team_id=team_id)
     except Team.DoesNotExist:
@@ -290,16 +672,25 @@ def distribute_team(request):
     distributed = []
     already_collected = []
 
+    # One conditional UPDATE hands the item to every member still missing it;
+    # rows stamped with this request's `now` are the ones it changed.
     with transaction.atomic():
-        members = team.members.select_for_update().all()
-        for member in members:
-            if getattr(member, field_name):
-                already_collected.append(member.uid)
+        team.members.filter(**{field_name: False}).update(
+            **{field_name: True, time_field_name: now},
+            items_mask=F('items_mask').bitor(ITEM_BITS[item]),
+            updated_at=now,
+        )
+        for uid, collected_at in team.members.values_list('uid', time_field_name):
+            if collected_at == now:
+                distributed.append(uid)
             else:
-                setattr(member, field_name, True)
-                setattr(member, time_field_name, now)
-                member.save(update_fields=[field_name, time_field_name])
-                distributed.append(member.uid)
+                already_collected.append(uid)
+
+    record_distribution(item, 'success', len(distributed))
+    record_distribution(item, 'already_collected', len(already_collected))
+    scan_cache.invalidate(*distributed)
+    if distributed:
+        publish_stats_delta({STAT_KEYS[item]: len(distributed)})
 
     return Response({
         'status': 'success',
@@ -311,51 +702,70 @@ def distribute_team(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@read_from_replica
+@etag_on_data_version
 def teams_stats(request):
     """
     GET /api/teams/stats/
     Returns team-level statistics and leaderboard.
+    Query params:
+      - limit: number of leaderboard rows (default 10, max 100)
+      - offset: leaderboard rows to skip (default 0)
     """
-    teams = Team.objects.all()
-    total_teams = teams.count()
-    solo_count = Participant.objects.filter(team__isnull=True).count()
-    team_members_count = Participant.objects.filter(team__isnull=False).count()
-
-    # Build leaderboard: top teams by completion rate
-    top_teams = []
-    for team in teams:
-        members = team.members.all()
-        member_count = members.count()
-        if member_count == 0:
-            continue
-
-        total_items = member_count * 6  # 6 distribution items per member
-        collected_items = 0
-        for field, _, _ in ITEM_FIELDS.values():
-            collected_items += members.filter(**{field: True}).count()
-
-        completion_rate = round((collected_items / total_items) * 100, 1) if total_items > 0 else 0
-        top_teams.append({
-            'team_id': team.team_id,
-            'team_name': team.team_name,
-            'team_color': team.team_color,
-            'members': member_count,
-            'completion_rate': completion_rate,
-        })
+    query = TeamsStatsQuerySerializer(data=request.query_params)
+    query.is_valid(raise_exception=True)
+    limit = query.validated_data['limit']
+    offset = query.validated_data['offset']
 
-    # Sort by completion rate descending, take top 10
-    top_teams.sort(key=lambda t: t['completion_rate'], reverse=True)
+    total_teams = Team.objects.count()
+    counters = _participant_counters()
+    solo_count = counters['solo_participants']
+    team_members_count = counters['total_participants'] - solo_count
+
+    # Leaderboard: one GROUP BY over team members, ranked in the database.
+    # Empty teams never appear because the grouping starts from Participant.
+    # Items collected per member is the popcount of items_mask.
+    collected = Sum(sum(
+        (F('items_mask').bitrightshift(bit).bitand(1) for bit in range(len(ITEM_FIELDS))),
+        start=Value(0),
+    ))
+    leaderboard = (
+        Participant.objects
+        .filter(team__isnull=False)
+        .values('team__team_id', 'team__team_name', 'team__team_color')
+        .annotate(members=Count('pk'), collected=collected)
+        .annotate(
+            completion=Cast('collected', FloatField()) * 100.0
+            / (F('members') * len(ITEM_FIELDS))
+        )
+        .order_by('-completion', 'team__team_name', 'team__team_id')
+    )[offset:offset + limit]
+
+    top_teams = [
+        {
+            'team_id': row['team__team_id'],
+            'team_name': row['team__team_name'],
+            'team_color': row['team__team_color'],
+            'members': row['members'],
+            'completion_rate': round(row['completion'], 1),
+        }
+        for row in leaderboard
+    ]
 
     return Response({
         'total_teams': total_teams,
         'solo_participants': solo_count,
         'average_team_size': round(team_members_count / total_teams, 1) if total_teams > 0 else 0,
-        'top_teams': top_teams[:10],
+        'top_teams': top_teams,
     })
 
 
+@gzip_page
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@renderer_classes(LIST_RENDERERS)
+@read_from_replica
+@etag_on_data_version
 def attendees_list(request):
     """
     GET /api/attendees/
@@ -363,12 +773,97 @@ def attendees_list(request):
     Query params:
       - search: search by name, uid, team name, or college
       - filter: 'all' | 'solo' | 'team' | 'checked_in' | 'not_checked_in'
+      - missing: comma-separated item keys; participants missing any of them
       - view: 'individual' | 'team' (team groups results by team)
+      - page_size / cursor: keyset pagination of the individual view, newest
+        first; pass the returned next_cursor to fetch the following page
+      - stream: '1' streams the individual view as incrementally written JSON
+      - format: 'columnar' returns participants as column arrays (not with stream)
     """
+    paging = AttendeesPageQuerySerializer(data=request.query_params)
+    paging.is_valid(raise_exception=True)
+
+    queryset = _filtered_attendees(request)
+    view_mode = request.query_params.get('view', 'individual')
+    columnar = _columnar(request)
+    if columnar:
+        encode_rows, encode_members = encode_participant_columns, encode_team_member_columns
+        extra = {'item_bits': list(ITEM_BITS)}
+    else:
+        encode_rows, encode_members = encode_participants, encode_team_members
+        extra = {}
+
+    if view_mode == 'team':
+        # Group by team from one ordered query: solo participants first, then
+        # teams by name, members newest first within each group.
+        rows = queryset.order_by(
+            F('team__team_name').asc(nulls_first=True), 'team_id', '-created_at',
+        )
+        teams_data = []
+        for team_pk, group in groupby(rows, key=attrgetter('team_id')):
+            members = list(group)
+            team = members[0].team
+            if team_pk is None:
+                header = {
+                    'team_id': None,
+                    'team_name': 'Individual Participants',
+                    'team_color': '#B0B0B0',
+                }
+            else:
+                header = {
+                    'team_id': team.team_id,
+                    'team_name': team.team_name,
+                    'team_color': team.team_color,
+                }
+            teams_data.append({
+                **header,
+                'member_count': len(members),
+                'members': encode_members(members),
+            })
+
+        return Response({'view': 'team', **extra, 'teams': teams_data})
+
+    # Individual view
+    if paging.validated_data['stream']:
+        if columnar:
+            return Response({
+                'status': 'error',
+                'message': 'stream is not supported with format=columnar.',
+            }, status=status.HTTP_400_BAD_REQUEST)
+        rows = queryset.order_by(*KEYSET_ORDERING).iterator(chunk_size=500)
+        return StreamingHttpResponse(
+            stream_json_list(
+                {'view': 'individual'}, 'attendees', rows,
+                encode_participant,
+            ),
+            content_type='application/json',
+        )
+
+    if 'page_size' in paging.validated_data or paging.validated_data.get('cursor'):
+        rows, next_cursor = keyset_page(
+            queryset,
+            paging.validated_data.get('cursor'),
+            paging.validated_data.get('page_size', DEFAULT_PAGE_SIZE),
+        )
+        return Response({
+            'view': 'individual',
+            **extra,
+            'attendees': encode_rows(rows),
+            'next_cursor': next_cursor,
+        })
+
+    return Response({'view': 'individual', **extra, 'attendees': encode_rows(queryset)})
+
+
+def _columnar(request):
+    return request.accepted_renderer.format == ColumnarRenderer.format
+
+
+def _filtered_attendees(request):
+    """Applies the attendee `search` and `filter` query params to the participant queryset."""
     queryset = Participant.objects.select_related('team').all()
     search = request.query_params.get('search', '').strip()
     filter_by = request.query_params.get('filter', 'all')
-    view_mode = request.query_params.get('view', 'individual')
 
     # Apply search
     if search:
@@ -385,46 +880,100 @@ def attendees_list(request):
     elif filter_by == 'team':
         queryset = queryset.filter(team__isnull=False)
     elif filter_by == 'checked_in':
-        queryset = queryset.filter(registration_goodies=True)
+        queryset = queryset.filter(items_mask__in=masks_with_all(ITEM_BITS['registration_goodies']))
     elif filter_by == 'not_checked_in':
-        queryset = queryset.filter(registration_goodies=False)
+        queryset = queryset.filter(items_mask__in=masks_missing_any(ITEM_BITS['registration_goodies']))
 
-    if view_mode == 'team':
-        # Group by team
-        teams_data = []
+    missing = request.query_params.get('missing', '').strip()
+    if missing:
+        items = missing.split(',')
+        unknown = [item for item in items if item not in ITEM_BITS]
+        if unknown:
+            raise ValidationError({'missing': [f'Unknown item "{unknown[0]}".']})
+        bits = sum(ITEM_BITS[item] for item in set(items))
+        queryset = queryset.filter(items_mask__in=masks_missing_any(bits))
 
-        # Solo participants group
-        solo = queryset.filter(team__isnull=True)
-        if solo.exists():
-            teams_data.append({
-                'team_id': None,
-                'team_name': 'Individual Participants',
-                'team_color': '#B0B0B0',
-                'member_count': solo.count(),
-                'members': TeamMemberSerializer(solo, many=True).data,
-            })
+    return queryset
 
-        # Grouped teams — get distinct teams that have members in the queryset
-        team_pks = set(
-            queryset.filter(team__isnull=False)
-            .values_list('team', flat=True)
-        )
-        for team in Team.objects.filter(pk__in=team_pks):
-            members = queryset.filter(team=team)
-            teams_data.append({
-                'team_id': team.team_id,
-                'team_name': team.team_name,
-                'team_color': team.team_color,
-                'member_count': members.count(),
-                'members': TeamMemberSerializer(members, many=True).data,
-            })
 
-        return Response({'view': 'team', 'teams': teams_data})
-    else:
-        # Individual view
-        from .serializers import ParticipantSerializer
-        data = ParticipantSerializer(queryset, many=True).data
-        return Response({'view': 'individual', 'attendees': data})
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def changes_feed(request):
+    """
+    GET /api/changes/?since=<cursor>
+    Returns participants, teams and pre-registered member slots modified since
+    `cursor`, plus the cursor to send on the next sync. Deletes are not listed
+    row by row: when anything was deleted since `cursor` (or without `since`,
+    the initial sync) every row is returned with `resync: true`, and the
+    client replaces its copy instead of merging into it.
+    """
+    query = ChangesQuerySerializer(data=request.query_params)
+    query.is_valid(raise_exception=True)
+
+    # Taken before reading so nothing written during the reads is skipped.
+    now = timezone.now()
+    deletes = DataVersion.deletes()
+    participants = Participant.objects.select_related('team')
+    teams = Team.objects.all()
+    slots = PreRegisteredMember.objects.select_related('team')
+    resync = True
+    if query.validated_data.get('since'):
+        since, seen_deletes = decode_since_cursor(query.validated_data['since'])
+        resync = seen_deletes != deletes
+    if not resync:
+        # A row stamped before the previous sync's read may have committed
+        # after it, up to WRITE_SETTLE_SECONDS later, so re-read that much
+        # history; clients apply rows idempotently.
+        since -= timedelta(seconds=settings.WRITE_SETTLE_SECONDS)
+        participants = participants.filter(updated_at__gte=since)
+        teams = teams.filter(updated_at__gte=since)
+        slots = slots.filter(updated_at__gte=since)
+
+    return Response({
+        'status': 'success',
+        'cursor': encode_since_cursor(now, deletes),
+        'resync': resync,
+        'participants': encode_participants(participants.order_by('updated_at', 'pk')),
+        'teams': TeamSerializer(teams.order_by('updated_at', 'pk'), many=True).data,
+        'prereg_members': PreRegisteredMemberSerializer(slots.order_by('updated_at', 'pk'), many=True).data,
+    })
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_attendees_csv(request):
+    """
+    GET /api/export/attendees.csv
+    Streams the attendee list (same search/filter params as /api/attendees/) as CSV.
+    """
+    rows = export_rows(_export_queryset(request))
+    response = StreamingHttpResponse(stream_csv(rows), content_type='text/csv; charset=utf-8')
+    response['Content-Disposition'] = f'attachment; filename="{_export_filename("csv")}"'
+    return response
+
+
+@api_view(['GET'])
+@permission_classes([IsAuthenticated])
+def export_attendees_xlsx(request):
+    """
+    GET /api/export/attendees.xlsx
+    Streams the attendee list (same search/filter params as /api/attendees/) as XLSX.
+    """
+    rows = export_rows(_export_queryset(request))
+    response = StreamingHttpResponse(
+        stream_xlsx(rows),
+        content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    )
+    response['Content-Disposition'] = f'attachment; filename="{_export_filename("xlsx")}"'
+    return response
+
+
+def _export_queryset(request):
+    return _filtered_attendees(request).order_by(*KEYSET_ORDERING).iterator(chunk_size=1000)
+
+
+def _export_filename(ext):
+    return f'BreachGate_Export_{timezone.localtime():%Y%m%d_%H%M%S}.{ext}'
 
 
 # ---------- Pre-Registration Endpoints ----------
@@ -432,16 +981,21 @@ def attendees_list(request):
 
 @api_view(['GET'])
 @permission_classes([IsAuthenticated])
+@etag_on_data_version
 def prereg_teams_list(request):
     """
     GET /api/prereg/teams/
     Returns all teams that have at least one unlinked pre-registered member slot.
     Used by the app to populate the team + member dropdowns at registration time.
     """
-    teams = Team.objects.prefetch_related('pre_registered').all()
+    teams = Team.objects.prefetch_related(Prefetch(
+        'pre_registered',
+        queryset=PreRegisteredMember.objects.filter(is_linked=False),
+        to_attr='unlinked_slots',
+    ))
     result = []
     for team in teams:
-        unlinked = team.pre_registered.filter(is_linked=False)
+        unlinked = team.unlinked_slots
         result.append({
             'team_id': team.team_id,
             'team_name': team.team_name,
@@ -457,6 +1011,7 @@ def prereg_teams_list(request):
 
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
+@publishes_stats
 def register_nfc_tag(request):
     """
     POST /api/prereg/register/
@@ -499,7 +1054,15 @@ def register_nfc_tag(request):
             team=slot.team,
         )
         slot.is_linked = True
-        slot.save(update_fields=['is_linked'])
+        slot.save(update_fields=['is_linked', 'updated_at'])
+
+    # The new member changes team_size for every cached teammate.
+    scan_cache.invalidate(uid)
+    scan_cache.invalidate_team(participant.team_id)
+    publish_stats_delta({
+        'total_participants': 1,
+        'solo_participants': 1 if participant.team_id is None else 0,
+    })
 
     return Response({
         'status': 'registered',